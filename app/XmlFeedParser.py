@@ -1,13 +1,131 @@
+import html
+import logging
 import re
+import time
 from datetime import datetime
-from typing import Union
+from typing import Any, Callable, Iterable, List, NamedTuple, Tuple, Union
 import xml.etree.ElementTree as ET
+import xml.parsers.expat
 from xml.etree.ElementTree import Element
 
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # optional: pip install "newsfeed[lxml]"
+    _lxml_etree = None
+
 from app.TextFormatter import TextFormatter
-from app.news_types import NewsResponse
+from app.exceptions import FeedRejectedException
+from app.news_types import Article, ArticleSource, NewsResponse, scoped_guid
 from app.text_parsers import is_uri_like_metadata_token, parse_date_from_text, trim_text
 
+class XmlEngine(NamedTuple):
+    """Parser backend: whole-document parse plus an incremental ``end``-event pull parser."""
+
+    name: str
+    fromstring: Callable[[Union[bytes, str]], Any]
+    pull_parser: Callable[[], Any]
+
+
+def _etree_pull_parser() -> Any:
+    return ET.XMLPullParser(events=("end",))
+
+
+# lxml: keep going past recoverable errors (instead of dropping the whole feed), no size
+# limits on big text nodes, and never load a DTD, expand entities or touch the network. An
+# undefined entity such as ``&nbsp;`` then becomes an entity node inside the text (see
+# ``_element_text``); the stdlib parser rejects such a feed outright.
+_LXML_PARSER_OPTIONS = dict(
+    recover=True, huge_tree=True, resolve_entities=False, no_network=True, load_dtd=False
+)
+
+
+def _lxml_fromstring(xml: Union[bytes, str]) -> Any:
+    if isinstance(xml, str):
+        # lxml refuses str input that carries an encoding declaration; parse it as UTF-8 bytes.
+        parser = _lxml_etree.XMLParser(encoding="utf-8", **_LXML_PARSER_OPTIONS)
+        return _lxml_etree.fromstring(xml.encode("utf-8"), parser)
+    return _lxml_etree.fromstring(xml, _lxml_etree.XMLParser(**_LXML_PARSER_OPTIONS))
+
+
+def _lxml_pull_parser() -> Any:
+    return _lxml_etree.XMLPullParser(events=("end",), **_LXML_PARSER_OPTIONS)
+
+
+XML_ENGINES: dict[str, XmlEngine] = {"etree": XmlEngine("etree", ET.fromstring, _etree_pull_parser)}
+if _lxml_etree is not None:
+    XML_ENGINES["lxml"] = XmlEngine("lxml", _lxml_fromstring, _lxml_pull_parser)
+
+
+_LXML_ENTITY = _lxml_etree.Entity if _lxml_etree is not None else None
+
+
+def resolve_xml_engine(name: str = "auto") -> XmlEngine:
+    """
+    ``"auto"`` picks lxml when it is installed and the stdlib ``xml.etree`` otherwise;
+    ``"lxml"`` / ``"etree"`` force one (``"lxml"`` falls back to etree when missing). Any
+    other name is logged and treated as ``"auto"``.
+    """
+    if name not in ("auto", "etree", "lxml"):
+        logging.debug(f"Unknown xml_parser {name!r}; using auto")
+        name = "auto"
+    if name == "etree":
+        return XML_ENGINES["etree"]
+    if name == "lxml" and "lxml" not in XML_ENGINES:
+        logging.debug("xml_parser lxml is not installed; using etree")
+    return XML_ENGINES.get("lxml", XML_ENGINES["etree"])
+
+
+class _PrologEnd(Exception):
+    """Raised by ``DoctypeGuard`` at the root element: the prolog is over."""
+
+
+class DoctypeGuard:
+    """
+    Expat pass over a feed's prolog, run on the same bytes ahead of the tree parser. Raises
+    ``FeedRejectedException`` at a DOCTYPE with an internal subset: the only place entities
+    can be declared, and something no feed needs. The declarations are never read, so entity
+    expansion bombs are blocked under every parser backend. Being a real XML tokenizer it is
+    not fooled by long comments or processing instructions before the DOCTYPE, or by UTF-16.
+    It stops at the root element, so the body of the feed costs nothing.
+    """
+
+    done: bool
+
+    def __init__(self):
+        self.done = False
+        self._parser = xml.parsers.expat.ParserCreate()
+        self._parser.StartDoctypeDeclHandler = self._start_doctype
+        self._parser.EntityDeclHandler = self._entity_decl
+        self._parser.StartElementHandler = self._start_element
+
+    def feed(self, data: Union[bytes, str], final: bool = False) -> None:
+        if self.done:
+            return
+        try:
+            self._parser.Parse(data, final)
+        except _PrologEnd:
+            self.done = True
+        except xml.parsers.expat.ExpatError:
+            # Malformed prolog: the tree parser reports it (expat-based, it stops at the same
+            # point; lxml never expands entities).
+            self.done = True
+
+    def _start_doctype(self, _name, _sysid, _pubid, has_internal_subset) -> None:
+        if has_internal_subset:
+            raise FeedRejectedException("Feed declares a DTD internal subset (entities)")
+
+    def _entity_decl(self, *_args) -> None:
+        raise FeedRejectedException("Feed declares DTD entities")
+
+    def _start_element(self, _name, _attributes) -> None:
+        raise _PrologEnd()
+
+
+def reject_internal_dtd(xml: Union[bytes, str]) -> None:
+    """Runs a whole document through ``DoctypeGuard``."""
+    DoctypeGuard().feed(xml, final=True)
+
+
 _DC_NS = "http://purl.org/dc/elements/1.1/"
 _MRSS_NS = "http://search.yahoo.com/mrss/"
 _ITUNES_NS = "http://www.itunes.com/dtds/podcast-1.0.dtd"
@@ -21,104 +139,286 @@ def _split_keyword_blob(blob: str) -> list[str]:
     return [trim_text(p) for p in re.split(r"[,;]", blob) if trim_text(p)]
 
 
+_DC_SUBJECT = _ns_tag(_DC_NS, "subject")
+_DC_CREATOR = _ns_tag(_DC_NS, "creator")
+_MRSS_KEYWORDS = _ns_tag(_MRSS_NS, "keywords")
+_ITUNES_KEYWORDS = _ns_tag(_ITUNES_NS, "keywords")
+
+# ``<item>`` child tags that feed an article: True collects every occurrence (in order), False
+# keeps the first one, like ``findall`` / ``find`` did.
+_ITEM_CHILD_DISPATCH: dict[str, bool] = {
+    "guid": False,
+    "title": False,
+    "description": False,
+    "link": False,
+    "pubDate": False,
+    "author": False,
+    _DC_CREATOR: False,
+    _MRSS_KEYWORDS: False,
+    "category": True,
+    _DC_SUBJECT: True,
+    _ITUNES_KEYWORDS: True,
+}
+
+
+def _element_text(el: Element) -> str:
+    """
+    ``el.text``, continued past entity references lxml kept as nodes. With ``recover`` and
+    no entity expansion, lxml stores an undefined entity (``&nbsp;`` in a feed without a DTD)
+    as a child node holding the text after it in its tail, so ``el.text`` alone would stop at
+    the entity. HTML entity names are decoded; unknown ones are kept as written.
+    """
+    if len(el) == 0:
+        return el.text or ""
+    parts = [el.text or ""]
+    for child in el:
+        if child.tag is _LXML_ENTITY:
+            parts.append(html.unescape(child.text))
+            parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _child_text(first: dict[str, Element], tag: str) -> str:
+    el = first.get(tag)
+    return trim_text(_element_text(el)) if el is not None else ""
+
+
+class FeedDocument(NamedTuple):
+    """Feed title plus the ``<item>`` elements read so far (at most ``limit``)."""
+
+    title: str
+    items: List[Element]
+
+
+class ArticleRecord(NamedTuple):
+    """Compact, picklable form of one parsed ``<item>`` (everything but the feed name)."""
+
+    author: str
+    title: str
+    description: str
+    url: str
+    publishedAt: str
+    publishedAtTimestamp: float
+    subjects: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+    guid: str
+
+
+class FeedRecords(NamedTuple):
+    """Trimmed feed title (before ``TextFormatter.format_name``) plus its article records."""
+
+    title: str
+    articles: List[ArticleRecord]
+
+
+def parse_feed_records(
+    xml: bytes,
+    limit: Union[int, None],
+    date_time_format: str,
+    engine_name: str = "auto",
+    time_budget: Union[float, None] = None,
+) -> FeedRecords:
+    """
+    Whole-document parse into records; the entry point of ``ParsePool`` worker processes.
+    Only picklable arguments: the source's ``name_formatter`` is applied by the caller.
+    """
+    parser = XmlFeedParser(
+        text_formatter=TextFormatter(date_time_format=date_time_format),
+        limit=limit,
+        engine=resolve_xml_engine(engine_name),
+        time_budget=time_budget,
+    )
+    return parser.parse_records(xml)
+
+
 class XmlFeedParser:
     formatter: TextFormatter
     limit: Union[int, None] = None
+    engine: XmlEngine
+    # CPU seconds this thread may spend parsing one feed (None = unbounded). Checked between
+    # chunks and items: a single parser call (one chunk, or ``fromstring``) is bounded only by
+    # ``max_feed_bytes``. ``ParsePool`` workers are killed mid-call when over budget.
+    time_budget: Union[float, None] = None
+    # Host of the feed URL; non-URL guids are namespaced with it (see ``scoped_guid``).
+    guid_scope: str = ""
 
     def __init__(
         self,
         text_formatter: TextFormatter,
         limit: Union[int, None] = None,
+        engine: Union[XmlEngine, None] = None,
+        time_budget: Union[float, None] = None,
+        guid_scope: str = "",
     ):
         self.formatter = text_formatter
         self.limit = limit
+        self.engine = engine if engine is not None else resolve_xml_engine()
+        self.time_budget = time_budget
+        self.guid_scope = guid_scope
+        self._cpu_deadline: Union[float, None] = None
 
-    def parse(self, xml: str) -> NewsResponse:
-        root = ET.fromstring(xml)
-        articles = []
+    def _start_budget(self) -> None:
+        if self.time_budget is not None:
+            self._cpu_deadline = time.thread_time() + self.time_budget
 
-        feed_name = self.get_text(root, ".//title")
-        feed_name = self.formatter.format_name(feed_name)
+    def _check_budget(self) -> None:
+        if self._cpu_deadline is not None and time.thread_time() > self._cpu_deadline:
+            raise FeedRejectedException(f"Feed parse exceeded its {self.time_budget:g}s budget")
 
-        for item in root.findall(".//item"):
-            date_time = self.get_datetime(item, "pubDate")
-            subjects: list[str] = []
-            keywords: list[str] = []
+    def parse(self, xml: Union[bytes, str]) -> NewsResponse:
+        """
+        Parses a whole document. Pass the raw response bytes: the parser then reads the
+        encoding from the XML declaration instead of relying on an earlier decode.
+        """
+        self._start_budget()
+        reject_internal_dtd(xml)
+        root = self.engine.fromstring(xml)
+        return self.build_response(FeedDocument(self.get_text(root, ".//title"), root.findall(".//item")))
 
-            def add_kw(text: str) -> None:
-                t = trim_text(text)
-                if t and t not in keywords and not is_uri_like_metadata_token(t):
-                    keywords.append(t)
+    def parse_records(self, xml: Union[bytes, str]) -> FeedRecords:
+        self._start_budget()
+        reject_internal_dtd(xml)
+        root = self.engine.fromstring(xml)
+        return self.build_records(FeedDocument(self.get_text(root, ".//title"), root.findall(".//item")))
 
-            def add_sub(text: str) -> None:
-                t = trim_text(text)
-                if t and t not in subjects:
-                    subjects.append(t)
+    def read_stream(self, chunks: Iterable[bytes]) -> FeedDocument:
+        """
+        Feeds ``chunks`` (raw body bytes, decoded per the XML declaration) to an incremental
+        parser and stops pulling more as soon as ``limit`` ``<item>`` elements are complete, so
+        the rest of a large feed is never downloaded or parsed. Items are returned unprocessed;
+        ``build_response`` turns them into articles.
+        """
+        self._start_budget()
+        parser = self.engine.pull_parser()
+        title: Union[str, None] = None
+        items: List[Element] = []
+        guard = DoctypeGuard()
+        for chunk in chunks:
+            # Checked before the parser sees the chunk, so no declaration is ever read.
+            guard.feed(chunk)
+            parser.feed(chunk)
+            self._check_budget()
+            for _event, element in parser.read_events():
+                if element.tag == "item":
+                    items.append(element)
+                    if self.limit is not None and len(items) >= self.limit:
+                        return FeedDocument(title or "", items)
+                elif element.tag == "title" and title is None:
+                    # Same element as ``find(".//title")``: the first title in document order.
+                    title = trim_text(_element_text(element))
+        parser.close()
+        return FeedDocument(title or "", items)
+
+    def build_response(self, document: FeedDocument) -> NewsResponse:
+        """Articles from ``document``'s items; each item element is cleared once it is used."""
+        return self.response_from_records(self.build_records(document))
+
+    def build_records(self, document: FeedDocument) -> FeedRecords:
+        """Records for (at most ``limit`` of) ``document``'s items, clearing each item element."""
+        records = []
+        for item in document.items:
+            self._check_budget()
+            records.append(self._build_record(item))
+            item.clear()
+            if self.limit is not None and len(records) >= self.limit:
+                break
+        return FeedRecords(document.title, records)
+
+    def response_from_records(self, records: FeedRecords) -> NewsResponse:
+        articles = []
 
-            for cat in item.findall("category"):
-                t = trim_text(cat.text or "")
-                if t:
-                    add_sub(t)
-                    dom = cat.get("domain")
-                    if dom:
-                        d = trim_text(dom)
-                        if d and not is_uri_like_metadata_token(d):
-                            add_kw(d)
-
-            for el in item.findall(_ns_tag(_DC_NS, "subject")):
-                blob = trim_text(el.text or "")
-                if blob:
-                    add_kw(blob)
-
-            author = self.get_text(item, "author")
-            if not author:
-                creator_el = item.find(_ns_tag(_DC_NS, "creator"))
-                if creator_el is not None:
-                    author = trim_text(creator_el.text or "")
-
-            mrss_kw = item.find(_ns_tag(_MRSS_NS, "keywords"))
-            if mrss_kw is not None:
-                blob = trim_text(mrss_kw.text or mrss_kw.get("content") or "")
-                if blob:
-                    for p in _split_keyword_blob(blob):
-                        add_kw(p)
-
-            for el in item.findall(_ns_tag(_ITUNES_NS, "keywords")):
-                blob = trim_text(el.text or "")
-                if blob:
-                    for p in _split_keyword_blob(blob):
-                        add_kw(p)
-
-            guid_text = self.get_text(item, "guid")
-
-            article_item = {
-                "source": {"id": "", "name": feed_name},
-                "author": author,
-                "title": self.get_text(item, "title"),
-                "description": self.get_text(item, "description"),
-                "url": self.get_text(item, "link"),
-                "urlToImage": "",
-                "publishedAt": self.format_datetime(date_time),
-                "publishedAtTimestamp": date_time.timestamp() if date_time else 0,
-                "content": "",
-                "subjects": subjects,
-                "keywords": keywords,
-                "guid": guid_text,
-            }
-
-            if self.is_a_valid_article(article_item):
-                articles.append(article_item)
+        source = ArticleSource.of("", self.formatter.format_name(records.title))
+
+        for record in records.articles:
+            articles.append(self._article_from_record(record, source))
 
             if self.limit is not None and len(articles) >= self.limit:
                 break
 
         return NewsResponse({"status": "ok", "totalResults": len(articles), "articles": articles})
 
-    def is_a_valid_article(self, article_item):
-        return (
-            article_item["title"] is not None
-            and article_item["url"] is not None
-            and article_item["publishedAt"] is not None
+    def _build_record(self, item: Element) -> ArticleRecord:
+        """One pass over ``item``'s children, then fields in the same order as separate finds."""
+        first: dict[str, Element] = {}
+        repeated: dict[str, list[Element]] = {}
+        for child in item:
+            tag = child.tag
+            is_repeated = _ITEM_CHILD_DISPATCH.get(tag)
+            if is_repeated is None:
+                continue
+            if is_repeated:
+                repeated.setdefault(tag, []).append(child)
+            elif tag not in first:
+                first[tag] = child
+
+        subjects: list[str] = []
+        keywords: list[str] = []
+        seen_subjects: set[str] = set()
+        seen_keywords: set[str] = set()
+
+        def add_kw(t: str) -> None:
+            # ``t`` is already trimmed.
+            if t and t not in seen_keywords and not is_uri_like_metadata_token(t):
+                seen_keywords.add(t)
+                keywords.append(t)
+
+        for cat in repeated.get("category", ()):
+            t = trim_text(_element_text(cat))
+            if t:
+                if t not in seen_subjects:
+                    seen_subjects.add(t)
+                    subjects.append(t)
+                dom = cat.get("domain")
+                if dom:
+                    add_kw(trim_text(dom))
+
+        for el in repeated.get(_DC_SUBJECT, ()):
+            add_kw(trim_text(_element_text(el)))
+
+        author = _child_text(first, "author")
+        if not author:
+            author = _child_text(first, _DC_CREATOR)
+
+        mrss_kw = first.get(_MRSS_KEYWORDS)
+        if mrss_kw is not None:
+            blob = trim_text(_element_text(mrss_kw) or mrss_kw.get("content") or "")
+            if blob:
+                for p in _split_keyword_blob(blob):
+                    add_kw(p)
+
+        for el in repeated.get(_ITUNES_KEYWORDS, ()):
+            blob = trim_text(_element_text(el))
+            if blob:
+                for p in _split_keyword_blob(blob):
+                    add_kw(p)
+
+        pub_date = _child_text(first, "pubDate")
+        date_time = parse_date_from_text(pub_date) if pub_date else None
+
+        return ArticleRecord(
+            author=author,
+            title=_child_text(first, "title"),
+            description=_child_text(first, "description"),
+            url=_child_text(first, "link"),
+            publishedAt=self.format_datetime(date_time),
+            publishedAtTimestamp=date_time.timestamp() if date_time else 0,
+            subjects=tuple(subjects),
+            keywords=tuple(keywords),
+            guid=_child_text(first, "guid"),
+        )
+
+    def _article_from_record(self, record: ArticleRecord, source: ArticleSource) -> Article:
+        return Article(
+            source=source,
+            author=record.author,
+            title=record.title,
+            description=record.description,
+            url=record.url,
+            publishedAt=record.publishedAt,
+            publishedAtTimestamp=record.publishedAtTimestamp,
+            subjects=record.subjects,
+            keywords=record.keywords,
+            guid=scoped_guid(record.guid, self.guid_scope),
         )
 
     def get_text(self, element: Element, tag: str, attribute=None):
@@ -136,14 +436,6 @@ class XmlFeedParser:
 
         return trim_text(text)
 
-    def get_datetime(
-        self, element: Element, tag, attribute=None
-    ) -> Union[datetime, None]:
-        text = self.get_text(element, tag, attribute)
-        if text is None or len(text) == 0:
-            return None
-        return parse_date_from_text(text)
-
     def format_datetime(self, datetime: Union[datetime, None]) -> str:
         if datetime is None:
             return ""
@@ -0,0 +1,50 @@
+"""
+Disk tier for articles evicted from memory by the retention limits.
+
+Evicted articles are appended as JSON lines (``NewsArticle`` plus ``article_id``) to
+``archive.jsonl`` in the user data directory, so history that no longer fits in memory is kept
+instead of lost.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import platformdirs
+
+from app.news_types import Article
+
+_ARCHIVE_FILE = "archive.jsonl"
+
+
+def article_archive_file_path() -> Path:
+    """``{user_data_dir}/newsfeed/archive.jsonl`` (e.g. ``~/.local/share/newsfeed`` on Linux)."""
+    return Path(platformdirs.user_data_dir("newsfeed", appauthor=False)) / _ARCHIVE_FILE
+
+
+class ArticleArchive:
+    path: Path
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path if path is not None else article_archive_file_path()
+        self._lock = threading.Lock()
+
+    def append(self, articles: Iterable[Article]) -> None:
+        lines = []
+        for article in articles:
+            record: Dict[str, Any] = dict(article.to_dict())
+            record["article_id"] = article.article_id
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        if not lines:
+            return
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.writelines(lines)
+            except OSError as e:
+                logging.debug(f"Could not write article archive {self.path}: {e}")
@@ -0,0 +1,153 @@
+"""
+SQLite article store for warm starts and history.
+
+Every refresh upserts the articles of the feeds that changed (one transaction, keyed by
+``article_id``), so the database holds every article seen, including ones the in-memory store
+has since dropped. At startup ``NewsFeed`` loads each configured feed's last saved listing
+(the rows of its latest save) and shows them before the first network round trip completes.
+
+The database is ``articles.sqlite3`` in the user data directory, in WAL mode so the refresh
+thread's writes never block a reader.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import platformdirs
+
+from app.news_types import Article
+
+_ARTICLE_DB_FILE = "articles.sqlite3"
+# Bump with a migration when the schema changes (stored in ``PRAGMA user_version``).
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    feed TEXT NOT NULL,
+    published_at REAL NOT NULL,
+    seen_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_published_at ON articles (published_at);
+CREATE INDEX IF NOT EXISTS articles_feed ON articles (feed, published_at);
+CREATE INDEX IF NOT EXISTS articles_feed_seen_at ON articles (feed, seen_at);
+"""
+_UPSERT = """
+INSERT INTO articles (id, feed, published_at, seen_at, data) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    feed = excluded.feed,
+    published_at = excluded.published_at,
+    seen_at = excluded.seen_at,
+    data = excluded.data
+"""
+
+
+def article_db_file_path() -> Path:
+    """``{user_data_dir}/newsfeed/articles.sqlite3`` (e.g. ``~/.local/share/newsfeed`` on Linux)."""
+    return Path(platformdirs.user_data_dir("newsfeed", appauthor=False)) / _ARTICLE_DB_FILE
+
+
+class ArticleDatabase:
+    path: Path
+    _conn: Optional[sqlite3.Connection]
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path if path is not None else article_db_file_path()
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def open(self) -> bool:
+        """Opens (creating if needed) the database. False when it cannot be used."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Used from the refresh thread too; ``_lock`` serializes access.
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, _SCHEMA_VERSION):
+                logging.debug(f"Article database {self.path} has schema {version}; not using it")
+                conn.close()
+                return False
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+        except (OSError, sqlite3.Error) as e:
+            logging.debug(f"Could not open article database {self.path}: {e}")
+            return False
+        self._conn = conn
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def load(self, feeds: Sequence[str], limit: Optional[int] = None) -> Dict[str, List[Article]]:
+        """
+        The articles of each feed's latest save, i.e. what it listed when last fetched (older
+        history stays in the database), per feed URL, oldest first; at most ``limit`` in
+        total, newest kept.
+        """
+        out: Dict[str, List[Article]] = {}
+        if not feeds:
+            return out
+        placeholders = ",".join("?" * len(feeds))
+        query = (
+            "SELECT a.feed, a.data FROM articles a JOIN ("
+            f"SELECT feed, MAX(seen_at) AS seen_at FROM articles WHERE feed IN ({placeholders}) "
+            "GROUP BY feed"
+            ") latest ON a.feed = latest.feed AND a.seen_at = latest.seen_at "
+            "ORDER BY a.published_at DESC"
+        )
+        params: List[object] = list(feeds)
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        try:
+            with self._lock:
+                if self._conn is None:
+                    return out
+                rows = self._conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            logging.debug(f"Could not read article database {self.path}: {e}")
+            return out
+        for feed, data in reversed(rows):
+            try:
+                article = Article.from_dict(json.loads(data))
+            except (ValueError, TypeError, AttributeError):
+                continue
+            out.setdefault(feed, []).append(article)
+        return out
+
+    def save(self, articles_by_feed: Mapping[str, Iterable[Article]]) -> None:
+        """Upserts the articles of each feed in one transaction."""
+        now = time.time()
+        rows = [
+            (
+                article.article_id,
+                feed,
+                article.publishedAtTimestamp or 0,
+                now,
+                json.dumps(article.to_dict(), ensure_ascii=False, separators=(",", ":")),
+            )
+            for feed, articles in articles_by_feed.items()
+            for article in articles
+        ]
+        if not rows:
+            return
+        try:
+            with self._lock:
+                if self._conn is None:
+                    return
+                with self._conn:
+                    self._conn.executemany(_UPSERT, rows)
+        except sqlite3.Error as e:
+            logging.debug(f"Could not write article database {self.path}: {e}")
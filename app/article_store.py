@@ -0,0 +1,358 @@
+"""
+Always-sorted article store behind ``NewsFeed.articles``.
+
+Articles are kept in ``publishedAtTimestamp`` order (ties by ``article_id``) in a pair of
+parallel lists searched with ``bisect``. A refresh hands over each re-polled source's articles;
+only articles that are new, changed or gone are inserted or removed, so the work per refresh
+follows what changed rather than the total number of articles. Unchanged articles keep their
+objects.
+
+New articles pass through a duplicate check first: hash indexes on canonical URL
+(``canonical_url``) and guid (scoped by feed host, see ``scoped_guid``) map the same story from
+another feed (wire copies, sister papers) to the record already stored. The story is kept
+once, with the other feeds in its ``alternate_sources``; items of one feed are never merged
+with each other. When the feed whose copy is stored stops listing the story, the first of the
+other feeds becomes its source.
+
+Retention limits (overall, per source and by age) evict the oldest articles; evicted articles
+go to an ``ArticleArchive`` when one is given. The age and overall cuts are slices off the
+sorted lists. A still-listed article that was evicted is not brought back by later polls
+unless it changes and would then survive retention.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Dict, Iterable, List, Set, Tuple, Union
+
+from app.article_archive import ArticleArchive
+from app.news_types import Article, ArticleSource
+from app.text_parsers import canonical_url
+
+_SortKey = Tuple[float, int]
+_MIN_ID = -(2**63)
+_MAX_ID = 2**63 - 1
+
+# Retention limits (config ``retention_*``; 0 = no limit).
+DEFAULT_RETENTION_MAX_ARTICLES = 5000
+DEFAULT_RETENTION_MAX_ARTICLES_PER_SOURCE = 0
+DEFAULT_RETENTION_MAX_AGE_HOURS = 0.0
+
+
+def _sort_key(article: Article) -> _SortKey:
+    return (article.publishedAtTimestamp or 0, article.article_id)
+
+
+def _carries(article: Article, source: ArticleSource) -> bool:
+    return source is article.source or source in article.alternate_sources
+
+
+class ArticleStore:
+    _keys: List[_SortKey]
+    _articles: List[Article]
+    _by_id: Dict[int, Article]
+    # Per source: article ID -> content hash of what it last listed.
+    _source_ids: Dict[str, Dict[int, int]]
+    _source_names: Dict[str, ArticleSource]
+    # Listings (source, article ID) per stored article.
+    _refs: Dict[int, int]
+    # Duplicate detection: canonical URL / guid -> stored ID; duplicate ID -> stored ID.
+    _by_canonical_url: Dict[str, int]
+    _by_guid: Dict[str, int]
+    _aliases: Dict[int, int]
+    _alias_ids: Dict[int, Set[int]]
+    # Sort keys of the stored articles per (primary) source, for the per-source limit.
+    _keys_by_source: Dict[ArticleSource, List[_SortKey]]
+    max_articles: int
+    max_articles_per_source: int
+    max_age_seconds: float
+    # ``now - max_age_seconds`` at the last ``enforce_retention``.
+    _age_cutoff: float
+    archive: Union[ArticleArchive, None]
+
+    def __init__(
+        self,
+        *,
+        max_articles: int = 0,
+        max_articles_per_source: int = 0,
+        max_age_seconds: float = 0,
+        archive: Union[ArticleArchive, None] = None,
+    ):
+        self.max_articles = max(0, int(max_articles))
+        self.max_articles_per_source = max(0, int(max_articles_per_source))
+        self.max_age_seconds = max(0.0, float(max_age_seconds))
+        self.archive = archive
+        self._age_cutoff = 0.0
+        self._keys_by_source = {}
+        self._keys = []
+        self._articles = []
+        self._by_id = {}
+        self._source_ids = {}
+        self._source_names = {}
+        self._refs = {}
+        self._by_canonical_url = {}
+        self._by_guid = {}
+        self._aliases = {}
+        self._alias_ids = {}
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    def replace_source(self, source: str, articles: Iterable[Article]) -> bool:
+        """
+        Makes ``articles`` the current articles of ``source``. Articles no source lists any
+        more are removed; new or changed ones are inserted at their sorted position, or
+        attached to the stored copy of the same story.
+
+        @return: True if the store changed.
+        """
+        incoming: Dict[int, Article] = {}
+        for article in articles:
+            incoming.setdefault(article.article_id, article)
+        previous = self._source_ids.get(source, {})
+        listed: Dict[int, int] = {}
+        changed = False
+
+        for article_id in previous.keys() - incoming.keys():
+            changed |= self._release(source, article_id)
+
+        for article_id, article in incoming.items():
+            self._source_names[source] = article.source
+            content = hash(article)
+            listed[article_id] = content
+            if article_id in previous:
+                if previous[article_id] != content:
+                    changed |= self._update(article)
+                continue
+            kept = self._find_duplicate(article)
+            if kept is None:
+                self._refs[article_id] = 1
+                self._insert(article)
+                changed = True
+                continue
+            self._refs[kept.article_id] += 1
+            if kept.article_id != article_id:
+                self._aliases[article_id] = kept.article_id
+                self._alias_ids.setdefault(kept.article_id, set()).add(article_id)
+            changed |= self._attach(kept, article.source)
+
+        self._source_ids[source] = listed
+        return changed
+
+    def snapshot(self, limit: Union[int, None] = None) -> List[Article]:
+        """Articles oldest first (the newest ``limit`` only, when given) as a new list."""
+        return self._articles[-limit:] if limit else list(self._articles)
+
+    def enforce_retention(self, now: float) -> bool:
+        """
+        Evicts articles past the age limit (undated ones are exempt), then the oldest of any
+        source over its limit, then the oldest overall. Each cut is found by bisection.
+
+        @param now: Current Unix time.
+        @return: True if anything was evicted.
+        """
+        evicted: List[Article] = []
+        if self.max_age_seconds:
+            self._age_cutoff = now - self.max_age_seconds
+            # Undated articles (timestamp 0) sort first; the age cut starts after them.
+            start = bisect.bisect_right(self._keys, (0, _MAX_ID))
+            end = bisect.bisect_left(self._keys, (self._age_cutoff, _MIN_ID))
+            evicted.extend(self._evict_range(start, end))
+        if self.max_articles_per_source:
+            over = [
+                self._by_id[key[1]]
+                for keys in self._keys_by_source.values()
+                for key in keys[: max(0, len(keys) - self.max_articles_per_source)]
+            ]
+            evicted.extend(self._evict_all(over))
+        if self.max_articles and len(self._articles) > self.max_articles:
+            evicted.extend(self._evict_range(0, len(self._articles) - self.max_articles))
+        if evicted and self.archive is not None:
+            self.archive.append(evicted)
+        return bool(evicted)
+
+    def _evict_range(self, start: int, end: int) -> List[Article]:
+        """
+        Evicts ``_articles[start:end]`` with one slice deletion per sorted list; only the hash
+        indexes are cleaned up article by article.
+        """
+        evicted = self._articles[start:end]
+        if not evicted:
+            return evicted
+        del self._keys[start:end]
+        del self._articles[start:end]
+        by_source: Dict[ArticleSource, List[Article]] = {}
+        for article in evicted:
+            self._drop_refs(article)
+            self._unindex(article)
+            by_source.setdefault(article.source, []).append(article)
+        for source, articles in by_source.items():
+            # A source's articles in a range of the global order are adjacent in its own list.
+            source_keys = self._keys_by_source[source]
+            index = bisect.bisect_left(source_keys, _sort_key(articles[0]))
+            del source_keys[index : index + len(articles)]
+            if not source_keys:
+                del self._keys_by_source[source]
+        return evicted
+
+    def _evict_all(self, articles: List[Article]) -> List[Article]:
+        for article in articles:
+            self._drop_refs(article)
+            self._remove(article)
+        return articles
+
+    def _drop_refs(self, article: Article) -> None:
+        self._refs.pop(article.article_id, None)
+        for alias_id in self._alias_ids.pop(article.article_id, ()):
+            self._aliases.pop(alias_id, None)
+
+    def _kept_by_retention(self, article: Article) -> bool:
+        """False when the next ``enforce_retention`` would evict ``article`` again at once."""
+        key = _sort_key(article)
+        if self.max_age_seconds and 0 < article.publishedAtTimestamp < self._age_cutoff:
+            return False
+        if self.max_articles and len(self._keys) >= self.max_articles and key < self._keys[0]:
+            return False
+        if self.max_articles_per_source:
+            source_keys = self._keys_by_source.get(article.source, ())
+            if len(source_keys) >= self.max_articles_per_source and key < source_keys[0]:
+                return False
+        return True
+
+    def _find_duplicate(self, article: Article) -> Union[Article, None]:
+        """
+        Stored copy of ``article``'s story from another feed: the same ID or guid, or the same
+        canonical URL unless both carry different guids. Items of one feed are never merged:
+        podcast episodes that all link to the show page, or live-blog entries whose links only
+        differ in tracking parameters, are separate articles.
+        """
+        stored_id = self._aliases.get(article.article_id, article.article_id)
+        if stored_id in self._by_id:
+            return self._by_id[stored_id]
+        kept = None
+        if article.guid:
+            stored_id = self._by_guid.get(article.guid)
+            if stored_id is not None:
+                kept = self._by_id[stored_id]
+        if kept is None and article.url:
+            stored_id = self._by_canonical_url.get(canonical_url(article.url))
+            if stored_id is not None:
+                kept = self._by_id[stored_id]
+                if article.guid and kept.guid and article.guid != kept.guid:
+                    return None
+        if kept is None or _carries(kept, article.source):
+            return None
+        return kept
+
+    def _update(self, article: Article) -> bool:
+        """
+        A listed article changed; only the feed whose copy is stored (its primary source) may
+        replace it, also when it was collapsed into a copy that came from another feed first.
+        One that retention evicted is stored again unless it would be evicted straight away.
+        """
+        stored_id = self._aliases.get(article.article_id, article.article_id)
+        current = self._by_id.get(stored_id)
+        if current is None:
+            # Evicted. Stored again only if it would survive retention: otherwise every
+            # poll that sees it changed would store, evict and archive it once more.
+            if article.article_id in self._aliases or not self._kept_by_retention(article):
+                return False
+            self._refs[article.article_id] = 1
+            self._insert(article)
+            return True
+        if current.source is not article.source:
+            return False
+        self._remove(current)
+        if stored_id != article.article_id:
+            self._rekey(stored_id, article.article_id)
+        self._insert(article, current.alternate_sources)
+        return True
+
+    def _rekey(self, old_id: int, new_id: int) -> None:
+        """The stored copy of a story changes from ``old_id`` to its alias ``new_id``."""
+        self._refs[new_id] = self._refs.pop(old_id)
+        alias_ids = self._alias_ids.pop(old_id, set())
+        alias_ids.discard(new_id)
+        alias_ids.add(old_id)
+        self._aliases.pop(new_id, None)
+        for alias_id in alias_ids:
+            self._aliases[alias_id] = new_id
+        self._alias_ids[new_id] = alias_ids
+
+    def _attach(self, kept: Article, source: ArticleSource) -> bool:
+        if _carries(kept, source):
+            return False
+        kept.alternate_sources = kept.alternate_sources + (source,)
+        return True
+
+    def _promote(self, article: Article) -> bool:
+        """Its primary source dropped ``article``: the first alternate source takes over."""
+        if not article.alternate_sources:
+            return False
+        self._remove(article)
+        article.source = article.alternate_sources[0]
+        self._insert(article, article.alternate_sources[1:])
+        return True
+
+    def _release(self, source: str, article_id: int) -> bool:
+        stored_id = self._aliases.get(article_id, article_id)
+        article = self._by_id.get(stored_id)
+        if article is None:
+            return False
+        refs = self._refs.get(stored_id, 0) - 1
+        if refs > 0:
+            self._refs[stored_id] = refs
+            name = self._source_names.get(source)
+            if name is not None and name is article.source:
+                return self._promote(article)
+            if name is not None and name in article.alternate_sources:
+                article.alternate_sources = tuple(
+                    s for s in article.alternate_sources if s is not name
+                )
+                return True
+            return False
+        del self._refs[stored_id]
+        for alias_id in self._alias_ids.pop(stored_id, ()):
+            self._aliases.pop(alias_id, None)
+        self._remove(article)
+        return True
+
+    def _insert(
+        self, article: Article, alternate_sources: Tuple[ArticleSource, ...] = ()
+    ) -> None:
+        """Stores ``article`` with ``alternate_sources`` (none for a newly seen story)."""
+        article.alternate_sources = alternate_sources
+        key = _sort_key(article)
+        index = bisect.bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._articles.insert(index, article)
+        self._by_id[article.article_id] = article
+        bisect.insort(self._keys_by_source.setdefault(article.source, []), key)
+        if article.guid:
+            self._by_guid.setdefault(article.guid, article.article_id)
+        if article.url:
+            self._by_canonical_url.setdefault(canonical_url(article.url), article.article_id)
+
+    def _remove(self, article: Article) -> None:
+        key = _sort_key(article)
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+            del self._articles[index]
+        source_keys = self._keys_by_source.get(article.source)
+        if source_keys is not None:
+            index = bisect.bisect_left(source_keys, key)
+            if index < len(source_keys) and source_keys[index] == key:
+                del source_keys[index]
+            if not source_keys:
+                del self._keys_by_source[article.source]
+        self._unindex(article)
+
+    def _unindex(self, article: Article) -> None:
+        del self._by_id[article.article_id]
+        if article.guid and self._by_guid.get(article.guid) == article.article_id:
+            del self._by_guid[article.guid]
+        if article.url:
+            canonical = canonical_url(article.url)
+            if self._by_canonical_url.get(canonical) == article.article_id:
+                del self._by_canonical_url[canonical]
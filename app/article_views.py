@@ -2,16 +2,24 @@ import html
 import math
 import re
 from collections import defaultdict
-from typing import Dict, List, Literal, Set, TypedDict
-
-from nltk.stem.snowball import SnowballStemmer
-
-from app.news_types import NewsArticle
+from typing import Any, Dict, List, Literal, Set, TypedDict
+
+from app.news_types import Article
+from app.stem_tables import (
+    LOCALE_TABLE_BASES,
+    LocaleStemTables,
+    StemTables,
+    load_stem_tables,
+    locale_tables_key,
+    stem_tables_digest,
+)
 from app.text_parsers import filter_metadata_keywords, is_uri_like_metadata_token
 
-_EN_STEMMER = SnowballStemmer("english")
-_FI_STEMMER = SnowballStemmer("finnish")
-_SV_STEMMER = SnowballStemmer("swedish")
+# nltk Snowball stemmers, created by ``_load_stem_tables`` when the similar-content view is
+# first built: importing nltk takes longer than the rest of startup together.
+_EN_STEMMER: Any = None
+_FI_STEMMER: Any = None
+_SV_STEMMER: Any = None
 
 ViewMode = Literal["chronological", "per_source", "by_matching_words"]
 
@@ -39,7 +47,7 @@ def _strip_html_for_text_analysis(raw: str) -> str:
     return " ".join(text.split())
 
 
-def _article_search_haystack(a: NewsArticle) -> str:
+def _article_search_haystack(a: Article) -> str:
     """Text used for keyword search (title, body fields, source name, author)."""
     src = a.get("source") or {}
     parts = [
@@ -56,7 +64,7 @@ def _article_search_haystack(a: NewsArticle) -> str:
     return " ".join(parts).lower()
 
 
-def _article_primary_grouping_text(a: NewsArticle) -> str:
+def _article_primary_grouping_text(a: Article) -> str:
     """RSS ``category`` / subject lines only — primary similar-content edges (no keyword metadata)."""
     parts: List[str] = []
     for s in a.get("subjects") or []:
@@ -66,7 +74,7 @@ def _article_primary_grouping_text(a: NewsArticle) -> str:
     return " ".join(parts).lower()
 
 
-def _article_keyword_meta_text(a: NewsArticle) -> str:
+def _article_keyword_meta_text(a: Article) -> str:
     """Non-URI keyword tags — unioned with description in the second attachment pass only."""
     parts = [
         _strip_html_for_text_analysis(k) for k in filter_metadata_keywords(a.get("keywords"))
@@ -74,7 +82,7 @@ def _article_keyword_meta_text(a: NewsArticle) -> str:
     return " ".join(parts).lower()
 
 
-def _article_title_description_text_only(a: NewsArticle) -> str:
+def _article_title_description_text_only(a: Article) -> str:
     """Title + description — keyword shelves (no subjects/keywords reuse)."""
     parts = [
         _strip_html_for_text_analysis(a.get("title") or ""),
@@ -83,7 +91,7 @@ def _article_title_description_text_only(a: NewsArticle) -> str:
     return " ".join(parts).lower()
 
 
-def _article_description_text(a: NewsArticle) -> str:
+def _article_description_text(a: Article) -> str:
     """Snippet only — combined with cleaned keywords for second-pass attachment to clusters."""
     return _strip_html_for_text_analysis(a.get("description") or "").lower()
 
@@ -121,12 +129,7 @@ _FI_META_STEM_SOURCES = frozenset(
         "uutisoivat",
     }
 )
-_FI_META_STEMS: frozenset[str] = frozenset(
-    sx
-    for w in _FI_META_STEM_SOURCES
-    for sx in (_FI_STEMMER.stem(w),)
-    if len(sx) >= _FI_META_STEM_MIN
-)
+_FI_META_STEMS: frozenset[str] = frozenset()
 
 # Per-locale stopword packs (merged with English core/boiler via ``set_enabled_locales``).
 _STOPWORDS_EN_CORE = frozenset(
@@ -429,12 +432,7 @@ _SV_META_STEM_SOURCES = frozenset(
         "rapporterats",
     }
 )
-_SV_META_STEMS: frozenset[str] = frozenset(
-    sx
-    for w in _SV_META_STEM_SOURCES
-    for sx in (_SV_STEMMER.stem(w),)
-    if len(sx) >= _SV_META_STEM_MIN
-)
+_SV_META_STEMS: frozenset[str] = frozenset()
 
 
 def _merge_stopwords_for_locales(bases: tuple[str, ...]) -> frozenset[str]:
@@ -447,22 +445,24 @@ def _merge_stopwords_for_locales(bases: tuple[str, ...]) -> frozenset[str]:
     return frozenset(acc)
 
 
-def _build_term_stopwords() -> frozenset[str]:
+def _build_term_stopwords(
+    bases: tuple[str, ...], fi_meta_stems: frozenset[str], sv_meta_stems: frozenset[str]
+) -> frozenset[str]:
     acc: set[str] = set()
-    for w in _STOPWORDS:
+    for w in _merge_stopwords_for_locales(bases):
         if len(w) >= _MIN_TOKEN_LEN:
             t = _EN_STEMMER.stem(w)
             if len(t) >= _MIN_TOKEN_LEN:
                 acc.add(t)
-    if "fi" in _active_locale_bases:
-        for sx in _FI_META_STEMS:
+    if "fi" in bases:
+        for sx in fi_meta_stems:
             if len(sx) >= _MIN_TOKEN_LEN:
                 acc.add(sx)
                 t2 = _EN_STEMMER.stem(sx)
                 if len(t2) >= _MIN_TOKEN_LEN:
                     acc.add(t2)
-    if "sv" in _active_locale_bases:
-        for sx in _SV_META_STEMS:
+    if "sv" in bases:
+        for sx in sv_meta_stems:
             if len(sx) >= _MIN_TOKEN_LEN:
                 acc.add(sx)
                 t2 = _EN_STEMMER.stem(sx)
@@ -473,7 +473,11 @@ def _build_term_stopwords() -> frozenset[str]:
 
 _active_locale_bases: tuple[str, ...] = ("fi",)
 _STOPWORDS: frozenset[str] = _merge_stopwords_for_locales(_active_locale_bases)
-_TERM_STOPWORDS: frozenset[str] = _build_term_stopwords()
+_TERM_STOPWORDS: frozenset[str] = frozenset()
+# Precomputed tables of every locale combination (``app.stem_tables``), once loaded.
+_stem_tables: StemTables | None = None
+# Whether the stem tables above (and ``_SHELF_STEM_SETS``) match the enabled locales.
+_stem_tables_ready = False
 
 
 _SUPPORTED_LOCALE_BASES = frozenset({"fi", "sv", "en"})
@@ -487,7 +491,7 @@ def set_enabled_locales(locales: List[str]) -> None:
     tag whose base language is ``fi``, ``sv``, or ``en``. Unknown base codes
     are skipped; at least one supported code must remain or this raises.
     """
-    global _active_locale_bases, _STOPWORDS, _TERM_STOPWORDS
+    global _active_locale_bases, _STOPWORDS, _stem_tables_ready
     if not locales:
         raise ValueError(
             'locales must be a non-empty list (set "locales" in config.json).'
@@ -504,7 +508,7 @@ def set_enabled_locales(locales: List[str]) -> None:
         )
     _active_locale_bases = tuple(seen)
     _STOPWORDS = _merge_stopwords_for_locales(_active_locale_bases)
-    _TERM_STOPWORDS = _build_term_stopwords()
+    _stem_tables_ready = False
 
 
 def _token_is_low_information(w: str) -> bool:
@@ -718,25 +722,102 @@ _KEYWORD_SHELF_SEEDS: List[tuple[str, tuple[str, ...]]] = [
 ]
 
 
-def _build_shelf_stem_sets() -> List[tuple[str, frozenset[str]]]:
+def _build_shelf_stem_sets(term_stopwords: frozenset[str]) -> List[tuple[str, frozenset[str]]]:
     out: List[tuple[str, frozenset[str]]] = []
     for heading, seeds in _KEYWORD_SHELF_SEEDS:
         stems: set[str] = set()
         for w in seeds:
             t = _normalize_term(w)
-            if t and t not in _TERM_STOPWORDS:
+            if t and t not in term_stopwords:
                 stems.add(t)
         if stems:
             out.append((heading, frozenset(stems)))
     return out
 
 
-_SHELF_STEM_SETS: List[tuple[str, frozenset[str]]] = _build_shelf_stem_sets()
+_SHELF_STEM_SETS: List[tuple[str, frozenset[str]]] = []
 _MIN_SHELF_STEM_OVERLAP = 1
 
 
+def _create_stemmers() -> None:
+    global _EN_STEMMER, _FI_STEMMER, _SV_STEMMER
+    if _EN_STEMMER is None:
+        from nltk.stem.snowball import SnowballStemmer
+
+        _EN_STEMMER = SnowballStemmer("english")
+        _FI_STEMMER = SnowballStemmer("finnish")
+        _SV_STEMMER = SnowballStemmer("swedish")
+
+
+def stem_table_inputs() -> Dict[str, Any]:
+    """Everything the stem tables are derived from, for ``stem_tables_digest``."""
+    import nltk
+
+    return {
+        "nltk": nltk.__version__,
+        "min_token_len": _MIN_TOKEN_LEN,
+        "fi_meta_stem_min": _FI_META_STEM_MIN,
+        "sv_meta_stem_min": _SV_META_STEM_MIN,
+        "stopwords_en_core": _STOPWORDS_EN_CORE,
+        "stopwords_en_boiler": _STOPWORDS_EN_BOILER,
+        "stopwords_fi": _STOPWORDS_FI,
+        "stopwords_sv": _STOPWORDS_SV,
+        "fi_meta_stem_sources": _FI_META_STEM_SOURCES,
+        "sv_meta_stem_sources": _SV_META_STEM_SOURCES,
+        "keyword_shelf_seeds": _KEYWORD_SHELF_SEEDS,
+    }
+
+
+def compute_stem_tables() -> StemTables:
+    """Runs Snowball over the word lists for every locale combination (``app.stem_tables``)."""
+    _create_stemmers()
+    fi_meta_stems = frozenset(
+        sx
+        for w in _FI_META_STEM_SOURCES
+        for sx in (_FI_STEMMER.stem(w),)
+        if len(sx) >= _FI_META_STEM_MIN
+    )
+    sv_meta_stems = frozenset(
+        sx
+        for w in _SV_META_STEM_SOURCES
+        for sx in (_SV_STEMMER.stem(w),)
+        if len(sx) >= _SV_META_STEM_MIN
+    )
+    locales: Dict[str, LocaleStemTables] = {}
+    for bases in LOCALE_TABLE_BASES:
+        term_stopwords = _build_term_stopwords(bases, fi_meta_stems, sv_meta_stems)
+        locales[locale_tables_key(bases)] = LocaleStemTables(
+            term_stopwords=term_stopwords,
+            shelf_stem_sets=_build_shelf_stem_sets(term_stopwords),
+        )
+    return StemTables(fi_meta_stems=fi_meta_stems, sv_meta_stems=sv_meta_stems, locales=locales)
+
+
+def _load_stem_tables() -> None:
+    """
+    Imports nltk (still needed to stem article words) and reads the precomputed stem tables on
+    first use by the similar-content view, computing them when the packaged file is stale;
+    after ``set_enabled_locales`` only picks the entry for the new locales.
+    """
+    global _FI_META_STEMS, _SV_META_STEMS, _TERM_STOPWORDS, _SHELF_STEM_SETS
+    global _stem_tables, _stem_tables_ready
+    if _stem_tables_ready:
+        return
+    _create_stemmers()
+    if _stem_tables is None:
+        _stem_tables = load_stem_tables(stem_tables_digest(stem_table_inputs()))
+        if _stem_tables is None:
+            _stem_tables = compute_stem_tables()
+        _FI_META_STEMS = _stem_tables["fi_meta_stems"]
+        _SV_META_STEMS = _stem_tables["sv_meta_stems"]
+    tables = _stem_tables["locales"][locale_tables_key(_active_locale_bases)]
+    _TERM_STOPWORDS = tables["term_stopwords"]
+    _SHELF_STEM_SETS = tables["shelf_stem_sets"]
+    _stem_tables_ready = True
+
+
 def _keyword_shelf_sections(
-    article_list: List[NewsArticle], leftover_indices: List[int]
+    article_list: List[Article], leftover_indices: List[int]
 ):
     """Bucket leftovers by title/description stem overlap with shelf seed sets."""
     remaining = set(leftover_indices)
@@ -941,7 +1022,7 @@ def _group_heading_explanation(
 
 class ArticleSection(TypedDict):
     heading: str | None
-    articles: List[NewsArticle]
+    articles: List[Article]
 
 
 VIEW_LABELS: dict[ViewMode, str] = {
@@ -952,8 +1033,8 @@ VIEW_LABELS: dict[ViewMode, str] = {
 
 
 def filter_articles_by_keyword(
-    articles: List[NewsArticle], query: str
-) -> List[NewsArticle]:
+    articles: List[Article], query: str
+) -> List[Article]:
     """
     Case-insensitive substring filter. Multiple whitespace-separated words require **all**
     to appear somewhere in title, description, content, source name, or author (AND).
@@ -968,17 +1049,17 @@ def filter_articles_by_keyword(
     return [a for a in articles if all(tok in _article_search_haystack(a) for tok in tokens)]
 
 
-def _newest_first(articles: List[NewsArticle]) -> List[NewsArticle]:
+def _newest_first(articles: List[Article]) -> List[Article]:
     return sorted(articles, key=lambda a: a["publishedAtTimestamp"], reverse=True)
 
 
-def _oldest_first(articles: List[NewsArticle]) -> List[NewsArticle]:
+def _oldest_first(articles: List[Article]) -> List[Article]:
     """Ascending time — scroll buffer grows downward; latest row sits at the bottom."""
     return sorted(articles, key=lambda a: a["publishedAtTimestamp"])
 
 
 def build_sections(
-    articles: List[NewsArticle],
+    articles: List[Article],
     mode: ViewMode,
     per_source_limit: int = 3,
 ) -> List[ArticleSection]:
@@ -989,16 +1070,23 @@ def build_sections(
         return [ArticleSection(heading=None, articles=_oldest_first(articles))]
 
     if mode == "per_source":
-        by_name: dict[str, List[NewsArticle]] = {}
+        by_name: dict[str, List[Article]] = {}
         for a in articles:
             name = a["source"]["name"] or "?"
             by_name.setdefault(name, []).append(a)
+            # A collapsed duplicate still belongs to the other feeds that carry it.
+            for alt in a.alternate_sources:
+                alt_name = alt.name or "?"
+                if alt_name != name:
+                    by_name.setdefault(alt_name, []).append(a)
         sections: List[ArticleSection] = []
         for name in sorted(by_name.keys(), key=lambda s: s.lower()):
             pick = _newest_first(by_name[name])[:per_source_limit]
             sections.append(ArticleSection(heading=name, articles=_oldest_first(pick)))
         return sections
 
+    _load_stem_tables()
+
     # by_matching_words: primary cliques from RSS subjects only; second pass matches description ∪
     # cleaned keywords to group topic stems; URI-like keyword junk ignored; then keyword shelves.
     article_list = list(articles)
@@ -0,0 +1,89 @@
+"""
+Per-source circuit breaker for feed fetching.
+
+A source that keeps failing is "opened": it is skipped (and keeps its last good articles) until
+an exponentially growing backoff has passed. Then a single probe request is let through
+("half-open"); success closes the circuit again, failure re-opens it with a doubled backoff.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from typing import Dict, Literal, NamedTuple, Union
+
+DEFAULT_BACKOFF_BASE_SECONDS = 60.0
+DEFAULT_BACKOFF_MAX_SECONDS = 3600.0
+# Consecutive failures before a source is skipped; a single blip is simply retried.
+_FAILURE_THRESHOLD = 2
+# Backoff lands within ±this fraction of its nominal value.
+_BACKOFF_JITTER_FRACTION = 0.1
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class SourceHealth(NamedTuple):
+    state: CircuitState
+    consecutive_failures: int
+    # Unix time after which an open circuit lets a probe through.
+    retry_at: float
+
+
+_HEALTHY = SourceHealth("closed", 0, 0.0)
+
+
+class CircuitBreaker:
+    backoff_base: float
+    backoff_max: float
+    _health: Dict[str, SourceHealth]
+
+    def __init__(
+        self,
+        backoff_base: float = DEFAULT_BACKOFF_BASE_SECONDS,
+        backoff_max: float = DEFAULT_BACKOFF_MAX_SECONDS,
+        rng: Union[random.Random, None] = None,
+    ):
+        self.backoff_base = max(1.0, float(backoff_base))
+        self.backoff_max = max(self.backoff_base, float(backoff_max))
+        self._rng = rng if rng is not None else random.Random()
+        self._health = {}
+        self._lock = threading.Lock()
+
+    def health(self, source: str) -> SourceHealth:
+        return self._health.get(source, _HEALTHY)
+
+    def allow(self, source: str, now: float) -> bool:
+        """
+        True when ``source`` may be fetched now. An open circuit past its backoff turns
+        half-open and lets exactly one probe through until that probe is recorded.
+        """
+        with self._lock:
+            health = self._health.get(source, _HEALTHY)
+            if health.state == "closed":
+                return True
+            if health.state == "open" and now >= health.retry_at:
+                self._health[source] = health._replace(state="half_open")
+                return True
+            return False
+
+    def record_success(self, source: str) -> None:
+        with self._lock:
+            self._health.pop(source, None)
+
+    def record_failure(self, source: str, now: float, trip: bool = False) -> None:
+        """
+        @param trip: Open the circuit on this failure instead of waiting for the threshold
+            (for failures that will certainly repeat, like an oversized feed).
+        """
+        with self._lock:
+            health = self._health.get(source, _HEALTHY)
+            failures = health.consecutive_failures + 1
+            if trip:
+                failures = max(failures, _FAILURE_THRESHOLD)
+            if health.state == "closed" and failures < _FAILURE_THRESHOLD:
+                self._health[source] = SourceHealth("closed", failures, 0.0)
+                return
+            exponent = min(failures - _FAILURE_THRESHOLD, 32)
+            backoff = min(self.backoff_max, self.backoff_base * (2 ** exponent))
+            backoff *= 1 + self._rng.uniform(-_BACKOFF_JITTER_FRACTION, _BACKOFF_JITTER_FRACTION)
+            self._health[source] = SourceHealth("open", failures, now + backoff)
@@ -0,0 +1,146 @@
+"""
+Feed date parsing and formatting.
+
+RSS ``pubDate`` values are RFC 822 and Atom / News API values are ISO 8601; both have fast paths
+here and only unusual spellings fall back to ``dateutil``. Parsed dates are converted to the
+local timezone, which is looked up once and re-checked periodically (DST switches, ``TZ``
+changes) instead of per item. Formatted strings are memoized per (date, timezone, format).
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Dict, Tuple, Union
+
+_MONTHS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+# RFC 822 / 2822 zone names; anything else goes to dateutil.
+_ZONE_OFFSET_HOURS = {
+    "GMT": 0,
+    "UT": 0,
+    "UTC": 0,
+    "Z": 0,
+    "EST": -5,
+    "EDT": -4,
+    "CST": -6,
+    "CDT": -5,
+    "MST": -7,
+    "MDT": -6,
+    "PST": -8,
+    "PDT": -7,
+}
+
+# ``Mon, 06 Sep 2021 10:00:00 +0300`` (weekday, seconds and zone optional).
+_RFC822_RE = re.compile(
+    r"^(?:[A-Za-z]{3},?\s+)?(\d{1,2})\s+([A-Za-z]{3})[a-z]*\s+(\d{4})\s+"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\s+([+-]\d{4}|[A-Za-z]{1,3}))?$"
+)
+
+# Local timezone is re-read at most this often (catches DST switches within a minute).
+_LOCAL_TZ_RECHECK_SECONDS = 60.0
+_local_tz: Union[tzinfo, None] = None
+_local_tz_checked_at = 0.0
+
+_FORMAT_CACHE_MAX = 8192
+_format_cache: Dict[Tuple[datetime, Union[tzinfo, None], str], str] = {}
+_format_cache_lock = threading.Lock()
+
+
+def local_timezone() -> tzinfo:
+    """The machine's current local timezone (cached, re-checked every minute)."""
+    global _local_tz, _local_tz_checked_at
+    now = time.monotonic()
+    if _local_tz is None or now - _local_tz_checked_at >= _LOCAL_TZ_RECHECK_SECONDS:
+        _local_tz = datetime.now().astimezone().tzinfo
+        _local_tz_checked_at = now
+    return _local_tz
+
+
+def parse_rfc822(text: str) -> Union[datetime, None]:
+    """Aware datetime for a well-formed RFC 822 date, ``None`` for anything else."""
+    m = _RFC822_RE.match(text)
+    if m is None:
+        return None
+    day, month_name, year, hour, minute, second, zone = m.groups()
+    month = _MONTHS.get(month_name[:3].lower())
+    if month is None:
+        return None
+    if zone is None:
+        tz: tzinfo = timezone.utc
+    elif zone[0] in "+-":
+        minutes = int(zone[1:3]) * 60 + int(zone[3:5])
+        tz = timezone(timedelta(minutes=-minutes if zone[0] == "-" else minutes))
+    else:
+        hours = _ZONE_OFFSET_HOURS.get(zone.upper())
+        if hours is None:
+            return None
+        tz = timezone(timedelta(hours=hours)) if hours else timezone.utc
+    try:
+        return datetime(
+            int(year), month, int(day), int(hour), int(minute), int(second or 0), tzinfo=tz
+        )
+    except ValueError:
+        return None
+
+
+def parse_iso8601(text: str) -> Union[datetime, None]:
+    """Datetime for an ISO 8601 timestamp (``2021-09-06T10:00:00Z`` …), ``None`` otherwise."""
+    if len(text) < 10 or not text[:4].isdigit() or text[4] != "-":
+        return None
+    if text[-1] in "Zz":
+        text = text[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def parse_date(text: str) -> Union[datetime, None]:
+    """
+    Parses a feed date and converts it to local time. Naive values are taken as UTC.
+    Returns ``None`` when the text is not a recognizable date.
+    """
+    parsed = parse_rfc822(text) or parse_iso8601(text)
+    if parsed is None:
+        # Imported here: only unusual spellings need it, and it is slow to import.
+        from dateutil.parser import parse as dateutil_parse
+
+        try:
+            parsed = dateutil_parse(text)
+        except (ValueError, OverflowError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    try:
+        return parsed.astimezone(local_timezone())
+    except (ValueError, OverflowError):
+        return None
+
+
+def format_date(date: datetime, date_time_format: str) -> str:
+    """``date.strftime(date_time_format)``, memoized."""
+    key = (date, date.tzinfo, date_time_format)
+    text = _format_cache.get(key)
+    if text is None:
+        text = date.strftime(date_time_format)
+        with _format_cache_lock:
+            if len(_format_cache) >= _FORMAT_CACHE_MAX:
+                _format_cache.clear()
+            _format_cache[key] = text
+    return text
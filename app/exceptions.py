@@ -1,2 +1,6 @@
 class NewsSourceException(Exception):
     pass
+
+
+class FeedRejectedException(NewsSourceException):
+    """A feed body tripped a parse guard: too large, declares entities, or over its time budget."""
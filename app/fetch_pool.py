@@ -0,0 +1,77 @@
+"""
+Feed fetches on daemon threads.
+
+``ThreadPoolExecutor`` workers are joined when the interpreter exits, so quitting while a slow
+server holds a request open would wait for that request's timeout. ``FetchPool`` runs the same
+kind of tasks on daemon threads that exit with the process instead; ``shutdown`` cancels the
+queued fetches and returns without waiting for the running ones.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Tuple, Union
+
+_Task = Tuple[Future, Callable[..., Any], Tuple[Any, ...]]
+
+
+class FetchPool:
+    max_workers: int
+    _tasks: "queue.SimpleQueue[Union[_Task, None]]"
+    _threads: List[threading.Thread]
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "newsfeed-fetch"):
+        self.max_workers = max(1, int(max_workers))
+        self._tasks = queue.SimpleQueue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._thread_name_prefix = thread_name_prefix
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queues ``fn(*args)``; starts another worker while fewer than ``max_workers`` run."""
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("submit after shutdown")
+            self._tasks.put((future, fn, args))
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._run,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def shutdown(self) -> None:
+        """Cancels queued tasks and stops the workers once their current task returns."""
+        with self._lock:
+            self._shutdown = True
+            while True:
+                try:
+                    task = self._tasks.get_nowait()
+                except queue.Empty:
+                    break
+                if task is not None:
+                    task[0].cancel()
+            for _ in self._threads:
+                self._tasks.put(None)
+
+    def _run(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
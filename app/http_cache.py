@@ -0,0 +1,169 @@
+"""
+On-disk HTTP validator cache for feed URLs.
+
+Each entry keeps the ``ETag`` / ``Last-Modified`` validators of the last ``200`` response together
+with the articles parsed from it, so the next poll can send a conditional request and reuse the
+stored articles when the server answers ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, TypedDict
+
+import platformdirs
+
+from app.news_types import Article, NewsResponse
+
+_HTTP_CACHE_FILE = "http_cache.json"
+# Bump when the entry layout changes; older files are ignored instead of misread.
+_HTTP_CACHE_VERSION = 1
+
+
+class HttpCacheEntry(TypedDict):
+    etag: str
+    last_modified: str
+    # ``limit`` and ``date_time_format`` the stored articles were parsed with.
+    limit: int
+    date_time_format: str
+    response: NewsResponse
+
+
+def http_cache_file_path() -> Path:
+    """``{user_cache_dir}/newsfeed/http_cache.json`` (e.g. ``~/.cache/newsfeed`` on Linux)."""
+    return Path(platformdirs.user_cache_dir("newsfeed", appauthor=False)) / _HTTP_CACHE_FILE
+
+
+class HttpValidatorCache:
+    path: Path
+    _entries: Dict[str, HttpCacheEntry]
+    _dirty: bool
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path if path is not None else http_cache_file_path()
+        self._entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Read entries from disk. A missing, unreadable or outdated file leaves the cache empty."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _HTTP_CACHE_VERSION:
+            return
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
+            return
+        loaded: Dict[str, HttpCacheEntry] = {}
+        for url, entry in entries.items():
+            try:
+                response = entry["response"]
+                response["articles"] = [Article.from_dict(a) for a in response["articles"]]
+            except (KeyError, TypeError, AttributeError):
+                continue
+            loaded[url] = entry
+        with self._lock:
+            self._entries = loaded
+
+    def save(self) -> None:
+        """Write entries to disk (atomically) when something changed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps(
+                {"version": _HTTP_CACHE_VERSION, "entries": self._entries},
+                ensure_ascii=False,
+                separators=(",", ":"),
+                default=_article_to_json,
+            )
+            self._dirty = False
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(payload, encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            logging.debug(f"Could not write HTTP cache {self.path}: {e}")
+
+    def lookup(self, url: str, limit: int, date_time_format: str) -> Optional[HttpCacheEntry]:
+        """
+        Entry for ``url`` whose articles can stand in for a fresh parse with ``limit`` items
+        in ``date_time_format``; ``None`` when there is none.
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if entry.get("limit", 0) < limit or entry.get("date_time_format") != date_time_format:
+            return None
+        return entry
+
+    def retain(self, urls: Iterable[str]) -> None:
+        """Drop entries for URLs that are no longer configured."""
+        keep = set(urls)
+        with self._lock:
+            stale = [url for url in self._entries if url not in keep]
+            for url in stale:
+                del self._entries[url]
+            if stale:
+                self._dirty = True
+
+    def store(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        *,
+        limit: int,
+        date_time_format: str,
+        response: NewsResponse,
+    ) -> None:
+        """
+        Remember validators from a ``200`` response; responses without any are not stored. The
+        file is rewritten only when the validators (or the parse settings the stored response
+        depends on) changed: a server that answers ``200`` with the same ETag every poll does
+        not cost a save per refresh.
+        """
+        etag = headers.get("ETag") or ""
+        last_modified = headers.get("Last-Modified") or ""
+        with self._lock:
+            if not etag and not last_modified:
+                if self._entries.pop(url, None) is not None:
+                    self._dirty = True
+                return
+            previous = self._entries.get(url)
+            self._entries[url] = HttpCacheEntry(
+                etag=etag,
+                last_modified=last_modified,
+                limit=limit,
+                date_time_format=date_time_format,
+                response=response,
+            )
+            if previous is None or (
+                previous["etag"],
+                previous["last_modified"],
+                previous["limit"],
+                previous["date_time_format"],
+            ) != (etag, last_modified, limit, date_time_format):
+                self._dirty = True
+
+
+def _article_to_json(value: Any) -> Any:
+    if isinstance(value, Article):
+        return value.to_dict()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def conditional_request_headers(entry: Optional[HttpCacheEntry]) -> Dict[str, str]:
+    """``If-None-Match`` / ``If-Modified-Since`` for a cached entry (empty without one)."""
+    if entry is None:
+        return {}
+    headers: Dict[str, str] = {}
+    if entry["etag"]:
+        headers["If-None-Match"] = entry["etag"]
+    if entry["last_modified"]:
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
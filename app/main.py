@@ -1,15 +1,26 @@
+from __future__ import annotations
+
 import bisect
 import contextlib
 import os
 import signal
 import sys
-import time
-from typing import Any, Dict, Generator, List, NamedTuple, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 from urllib.parse import quote
 
 from blessed import Terminal
 
-from app.NewsFeed import NewsFeed
 from app.article_views import (
     VIEW_LABELS,
     ArticleSection,
@@ -18,7 +29,19 @@ from app.article_views import (
     filter_articles_by_keyword,
     set_enabled_locales,
 )
-from app.news_types import NewsAppConfig, NewsArticle
+from app.news_types import Article, NewsAppConfig
+from app.poll_scheduler import (
+    DEFAULT_POLL_MAX_INTERVAL_SECONDS,
+    DEFAULT_POLL_MIN_INTERVAL_SECONDS,
+    PollScheduler,
+)
+from app.refresh_worker import RefreshWorker
+from app.ui_snapshot import (
+    UiSnapshot,
+    discard_ui_snapshot,
+    load_ui_snapshot,
+    save_ui_snapshot,
+)
 from app.ui_state import (
     MAX_PER_SOURCE_ARTICLES,
     load_ui_state,
@@ -26,6 +49,9 @@ from app.ui_state import (
     ui_state_file_path,
 )
 
+if TYPE_CHECKING:
+    from app.NewsFeed import NewsFeed
+
 # Fixed chrome height: title, shortcuts, blank line before scroll region
 _HEADER_ROWS = 3
 
@@ -258,12 +284,15 @@ def _wrap_words_plain(text: str, width: int) -> List[str]:
     return lines
 
 
-def _meta_lines(term: Terminal, article: NewsArticle, width: int) -> List[str]:
+def _meta_lines(term: Terminal, article: Article, width: int) -> List[str]:
     plain = f"{article['publishedAt']} - {article['source']['name']}"
+    if article.alternate_sources:
+        # Same story in other feeds; stored and shown once.
+        plain += " (also " + ", ".join(s.name or "?" for s in article.alternate_sources) + ")"
     return [term.darkseagreen4(line) for line in _wrap_words_plain(plain, width)]
 
 
-def _title_lines(term: Terminal, article: NewsArticle, width: int) -> List[str]:
+def _title_lines(term: Terminal, article: Article, width: int) -> List[str]:
     return [term.green(line) for line in _wrap_words_plain(article["title"], width)]
 
 
@@ -286,7 +315,7 @@ def _url_lines(_term: Terminal, url: str, width: int) -> List[str]:
 
 
 def _article_block_lines(
-    term: Terminal, article: NewsArticle, col_width: int
+    term: Terminal, article: Article, col_width: int
 ) -> List[str]:
     lines: List[str] = []
     lines.extend(_meta_lines(term, article, col_width))
@@ -906,34 +935,51 @@ def refresh_display(
     editing = bool(search_state.get("editing"))
     buffer = str(search_state.get("buffer") or "")
 
-    raw_articles = news_feed.get_latest_articles()
-    aid = id(raw_articles)
+    # Generation first: ``update`` publishes articles before bumping it, so the articles read
+    # next are at least that new. Painting never waits on the network.
+    generation = news_feed.generation
+    raw_articles = news_feed.articles
     # While typing in search mode, filter by buffer live; otherwise use committed query.
     effective_filter = buffer if editing else query
-    if effective_filter.strip():
-        articles = filter_articles_by_keyword(raw_articles, effective_filter)
-    else:
-        articles = raw_articles
     filter_label = buffer.strip() if editing else query
-    sections = build_sections(
-        articles,
-        view_mode,
-        per_source_limit=per_source_limit_ref[0],
-    )
+    # Filtering and grouping (similar-content clustering especially) only rerun when the
+    # articles or the view inputs changed, not on every key press or resize.
+    sections_key = (generation, effective_filter.strip(), view_mode, per_source_limit_ref[0])
+    if paint_state.get("sections_key") == sections_key:
+        sections = paint_state["sections"]
+    else:
+        if effective_filter.strip():
+            articles = filter_articles_by_keyword(raw_articles, effective_filter)
+        else:
+            articles = raw_articles
+        sections = build_sections(
+            articles,
+            view_mode,
+            per_source_limit=per_source_limit_ref[0],
+        )
+        paint_state["sections_key"] = sections_key
+        paint_state["sections"] = sections
     column_count = max(1, min(column_count_ref[0], _MAX_SPLIT_COLUMNS))
     if column_count_ref[0] != column_count:
         column_count_ref[0] = column_count
-    layout = _build_body_layout(term, sections, column_count, view_mode)
-
     tw_w, tw_h = _tty_dimensions(term)
     hw = (tw_h, tw_w)
+    # Wrapping is redone only for new sections or a new geometry, not for every scroll step.
+    layout_key = (sections_key, column_count, hw)
+    if paint_state.get("layout_key") == layout_key:
+        layout = paint_state["layout"]
+    else:
+        layout = _build_body_layout(term, sections, column_count, view_mode)
+        paint_state["layout_key"] = layout_key
+        paint_state["layout"] = layout
+
     search_digest = (query, editing, buffer)
     ps_lim = per_source_limit_ref[0]
     ps_edit = bool(per_source_limit_state.get("editing"))
     ps_buf = str(per_source_limit_state.get("buffer") or "")
     per_source_digest = (ps_lim, ps_edit, ps_buf)
     need_full = (
-        paint_state.get("articles_ref") != aid
+        paint_state.get("articles_generation") != generation
         or paint_state.get("view_mode") != view_mode
         or paint_state.get("hw") != hw
         or paint_state.get("column_count") != column_count
@@ -942,7 +988,7 @@ def refresh_display(
     )
 
     if need_full:
-        paint_state["articles_ref"] = aid
+        paint_state["articles_generation"] = generation
         paint_state["view_mode"] = view_mode
         paint_state["hw"] = hw
         paint_state["column_count"] = column_count
@@ -966,33 +1012,171 @@ def refresh_display(
         _paint_body_viewport(term, layout, scroll_ref, stick_bottom_ref)
 
 
-def execute(config: NewsAppConfig) -> None:
-    set_enabled_locales(config["locales"])
+def _terminal_signature(term: Terminal) -> str:
+    return f"{term.kind}/{term.number_of_colors}"
+
+
+def _ui_snapshot_from_paint_state(
+    term: Terminal,
+    paint_state: dict[str, Any],
+    news_feed: NewsFeed,
+    scroll_ref: List[int],
+    stick_bottom_ref: List[bool],
+) -> Optional[Dict[str, Any]]:
+    """
+    What is on screen now, for the next launch. None while a search filter or prompt is
+    active: the next launch starts without them, so this screen would be wrong.
+    """
+    if "layout" not in paint_state or paint_state.get("search_digest") != ("", False, ""):
+        return None
+    per_source_limit, ps_editing, _ps_buffer = paint_state["per_source_digest"]
+    if ps_editing:
+        return None
+    generation, _filter, view_mode, _limit = paint_state["sections_key"]
+    if generation != news_feed.generation:
+        return None
+    return {
+        "terminal": _terminal_signature(term),
+        "hw": list(paint_state["hw"]),
+        "view_mode": view_mode,
+        "column_count": paint_state["column_count"],
+        "per_source_limit": per_source_limit,
+        "scroll": scroll_ref[0],
+        "stick_bottom": stick_bottom_ref[0],
+        "article_ids": [a.article_id for a in news_feed.articles],
+        "sections": [
+            [sec["heading"], [a.article_id for a in sec["articles"]]]
+            for sec in paint_state["sections"]
+        ],
+        "layout": paint_state["layout"]._asdict(),
+    }
+
+
+def _layout_from_ui_snapshot(
+    term: Terminal,
+    snapshot: Optional[UiSnapshot],
+    view_mode: ViewMode,
+    column_count: int,
+    per_source_limit: int,
+) -> Optional[BodyLayout]:
+    """The snapshot's body layout when it was drawn for this terminal and these settings."""
+    if snapshot is None:
+        return None
+    tw_w, tw_h = _tty_dimensions(term)
+    try:
+        if (
+            snapshot["terminal"] != _terminal_signature(term)
+            or tuple(snapshot["hw"]) != (tw_h, tw_w)
+            or snapshot["view_mode"] != view_mode
+            or snapshot["column_count"] != column_count
+            or snapshot["per_source_limit"] != per_source_limit
+        ):
+            return None
+        data = snapshot["layout"]
+        return BodyLayout(
+            split=bool(data["split"]),
+            n_cols=int(data["n_cols"]),
+            single=list(data["single"]) if data["single"] is not None else None,
+            columns=tuple(list(c) for c in data["columns"]) if data["columns"] is not None else None,
+            col_width=int(data["col_width"]),
+            gutter=int(data["gutter"]),
+            col_xs=tuple(int(x) for x in data["col_xs"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _seed_paint_state_from_ui_snapshot(
+    paint_state: dict[str, Any],
+    snapshot: UiSnapshot,
+    layout: BodyLayout,
+    news_feed: NewsFeed,
+    hw: Tuple[int, int],
+) -> None:
+    """
+    When the saved articles loaded at startup are the ones the snapshot showed, reuse its
+    sections and layout (so the first ``refresh_display`` neither regroups nor repaints);
+    the first fetch that changes anything recomputes them.
+    """
+    # Generation first, as in ``refresh_display``: the first fetch may be publishing already.
+    generation = news_feed.generation
+    articles = news_feed.articles
+    if [a.article_id for a in articles] != snapshot["article_ids"]:
+        return
+    by_id = {a.article_id: a for a in articles}
+    try:
+        sections = [
+            ArticleSection(heading=heading, articles=[by_id[i] for i in ids])
+            for heading, ids in snapshot["sections"]
+        ]
+    except (KeyError, TypeError, ValueError):
+        return
+    view_mode = snapshot["view_mode"]
+    column_count = snapshot["column_count"]
+    per_source_limit = snapshot["per_source_limit"]
+    sections_key = (generation, "", view_mode, per_source_limit)
+    paint_state.update(
+        sections_key=sections_key,
+        sections=sections,
+        layout_key=(sections_key, column_count, hw),
+        layout=layout,
+        articles_generation=generation,
+        view_mode=view_mode,
+        hw=hw,
+        column_count=column_count,
+        search_digest=("", False, ""),
+        per_source_digest=(per_source_limit, False, ""),
+    )
+
+
+def _stop_news_feed(started: "Future[Tuple[NewsFeed, RefreshWorker]]") -> None:
+    """
+    Stops the refresh worker and closes the feed built by ``_start_news_feed``, waiting for the
+    startup thread if it is still building them.
+    """
+    try:
+        news_feed, refresh_worker = started.result()
+    except Exception:
+        # Already raised in the main thread, or the feed never started.
+        return
+    refresh_worker.stop()
+    news_feed.close()
+
+
+def _start_news_feed(
+    config: NewsAppConfig, fetch_limit_per_source: Callable[[], int]
+) -> Tuple[NewsFeed, RefreshWorker]:
+    """
+    Builds the feed (loading the saved articles) and starts its refresh worker, whose first
+    refresh polls every source.
+    """
+    # Imported here: requests and the parsers are not needed for the first frame.
+    from app.NewsFeed import NewsFeed
+
     news_feed = NewsFeed(
         config=config,
     )
-    term = Terminal()
-    saved_ui = load_ui_state()
-    _vm = saved_ui.get("view_mode")
-    _initial_vm: ViewMode = (
-        _vm
-        if _vm in ("chronological", "per_source", "by_matching_words")
-        else "chronological"
+    poll_scheduler = PollScheduler(
+        news_feed.news_sources,
+        default_interval=float(config["news_update_frequency_in_seconds"]),
+        min_interval=float(
+            config.get("poll_min_interval_seconds", DEFAULT_POLL_MIN_INTERVAL_SECONDS)
+        ),
+        max_interval=float(
+            config.get("poll_max_interval_seconds", DEFAULT_POLL_MAX_INTERVAL_SECONDS)
+        ),
     )
-    view_mode_ref: List[ViewMode] = [_initial_vm]
-    scroll_ref: List[int] = [10**9]
-    stick_bottom_ref: List[bool] = [True]
-    def _initial_column_count(saved: Dict[str, Any]) -> int:
-        cc = saved.get("column_count")
-        if isinstance(cc, int) and cc >= 1:
-            return min(cc, _MAX_SPLIT_COLUMNS)
-        if saved.get("split_columns") is True:
-            return min(2, _MAX_SPLIT_COLUMNS)
-        return 1
+    refresh_worker = RefreshWorker(
+        news_feed,
+        poll_scheduler,
+        fetch_limit_per_source=fetch_limit_per_source,
+    )
+    refresh_worker.start()
+    return news_feed, refresh_worker
+
 
-    column_count_ref: List[int] = [_initial_column_count(saved_ui)]
-    paint_state: dict[str, Any] = {}
-    search_state: dict[str, Any] = {"query": "", "editing": False, "buffer": ""}
+def execute(config: NewsAppConfig) -> None:
+    saved_ui = load_ui_state()
 
     def _initial_per_source_article_limit(saved: Dict[str, Any]) -> int:
         v = saved.get("per_source_article_limit")
@@ -1005,44 +1189,118 @@ def execute(config: NewsAppConfig) -> None:
         return 3
 
     per_source_limit_ref: List[int] = [_initial_per_source_article_limit(saved_ui)]
-    per_source_limit_state: dict[str, Any] = {"editing": False, "buffer": ""}
 
     def _feed_fetch_per_source() -> int:
         return max(10, per_source_limit_ref[0])
 
-    def persist_ui_state() -> None:
-        save_ui_state(
-            {
-                "view_mode": view_mode_ref[0],
-                "column_count": column_count_ref[0],
-                "per_source_article_limit": per_source_limit_ref[0],
-            }
-        )
-
-    def on_resize(*_args: object) -> None:
-        refresh_display(
-            term,
-            news_feed,
-            view_mode_ref[0],
-            scroll_ref,
-            stick_bottom_ref,
-            column_count_ref,
-            paint_state,
-            search_state,
-            per_source_limit_ref,
-            per_source_limit_state,
-        )
-
-    signal.signal(signal.SIGWINCH, on_resize)
-
     def on_sigint(_sig: object, _frame: object) -> None:
-        persist_ui_state()
+        # Unwinds through ``on_exit`` below, which saves the UI state and stops the feed.
         sys.exit(0)
 
-    signal.signal(signal.SIGINT, on_sigint)
+    with contextlib.ExitStack() as on_exit:
+        # Callbacks run last to first, whether the loop ends on ``q``, Ctrl-C or an error.
+        # Ctrl-C is handled from here on, so it cannot land between starting the feed and
+        # registering its cleanup.
+        signal.signal(signal.SIGINT, on_sigint)
+        # The feed is built and the first fetch started on a startup thread right away, so the
+        # network round trips overlap the locale tables, terminal and UI state set up here and
+        # the snapshot paint. The main thread waits for it only after the first frame.
+        startup = ThreadPoolExecutor(max_workers=1, thread_name_prefix="newsfeed-startup")
+        news_feed_started = startup.submit(_start_news_feed, config, _feed_fetch_per_source)
+        startup.shutdown(wait=False)
+        on_exit.callback(_stop_news_feed, news_feed_started)
+
+        set_enabled_locales(config["locales"])
+        term = Terminal()
+        _vm = saved_ui.get("view_mode")
+        _initial_vm: ViewMode = (
+            _vm
+            if _vm in ("chronological", "per_source", "by_matching_words")
+            else "chronological"
+        )
+        view_mode_ref: List[ViewMode] = [_initial_vm]
+        scroll_ref: List[int] = [10**9]
+        stick_bottom_ref: List[bool] = [True]
+        def _initial_column_count(saved: Dict[str, Any]) -> int:
+            cc = saved.get("column_count")
+            if isinstance(cc, int) and cc >= 1:
+                return min(cc, _MAX_SPLIT_COLUMNS)
+            if saved.get("split_columns") is True:
+                return min(2, _MAX_SPLIT_COLUMNS)
+            return 1
+
+        column_count_ref: List[int] = [_initial_column_count(saved_ui)]
+        paint_state: dict[str, Any] = {}
+        search_state: dict[str, Any] = {"query": "", "editing": False, "buffer": ""}
+        per_source_limit_state: dict[str, Any] = {"editing": False, "buffer": ""}
+
+        def persist_ui_state() -> None:
+            save_ui_state(
+                {
+                    "view_mode": view_mode_ref[0],
+                    "column_count": column_count_ref[0],
+                    "per_source_article_limit": per_source_limit_ref[0],
+                }
+            )
+
+        def persist_ui_snapshot() -> None:
+            snapshot = _ui_snapshot_from_paint_state(
+                term, paint_state, news_feed, scroll_ref, stick_bottom_ref
+            )
+            if snapshot is None:
+                discard_ui_snapshot()
+            else:
+                save_ui_snapshot(snapshot)
+
+        def on_resize(*_args: object) -> None:
+            refresh_display(
+                term,
+                news_feed,
+                view_mode_ref[0],
+                scroll_ref,
+                stick_bottom_ref,
+                column_count_ref,
+                paint_state,
+                search_state,
+                per_source_limit_ref,
+                per_source_limit_state,
+            )
+
+        on_exit.callback(persist_ui_state)
+        on_exit.enter_context(term.fullscreen())
+        on_exit.enter_context(term.cbreak())
+        on_exit.enter_context(term.hidden_cursor())
+        # First frame: the last screen of the previous run, painted without waiting for the
+        # feed, the article database or the parsers. The first ``refresh_display`` keeps it
+        # when the saved articles match, and repaints otherwise.
+        snapshot = load_ui_snapshot()
+        snapshot_layout = _layout_from_ui_snapshot(
+            term, snapshot, view_mode_ref[0], column_count_ref[0], per_source_limit_ref[0]
+        )
+        if snapshot is not None and snapshot_layout is not None:
+            scroll_ref[0] = int(snapshot["scroll"])
+            stick_bottom_ref[0] = bool(snapshot["stick_bottom"])
+            _paint_full(
+                term,
+                snapshot_layout,
+                view_mode_ref[0],
+                scroll_ref,
+                stick_bottom_ref,
+                requested_columns=column_count_ref[0],
+                per_source_limit=per_source_limit_ref[0],
+            )
+
+        news_feed, refresh_worker = news_feed_started.result()
+        # Saved before the terminal is restored and the feed stopped.
+        on_exit.callback(persist_ui_snapshot)
+        if snapshot is not None and snapshot_layout is not None:
+            tw_w, tw_h = _tty_dimensions(term)
+            _seed_paint_state_from_ui_snapshot(
+                paint_state, snapshot, snapshot_layout, news_feed, (tw_h, tw_w)
+            )
+
+        signal.signal(signal.SIGWINCH, on_resize)
 
-    with term.fullscreen(), term.cbreak(), term.hidden_cursor():
-        news_feed.update(fetch_limit_per_source=_feed_fetch_per_source())
         refresh_display(
             term,
             news_feed,
@@ -1057,12 +1315,24 @@ def execute(config: NewsAppConfig) -> None:
         )
         if not ui_state_file_path().exists():
             persist_ui_state()
-        last_poll = time.monotonic()
-        interval = float(config["news_update_frequency_in_seconds"])
 
         while True:
             key = term.inkey(timeout=0.2)
 
+            if refresh_worker.take_update():
+                refresh_display(
+                    term,
+                    news_feed,
+                    view_mode_ref[0],
+                    scroll_ref,
+                    stick_bottom_ref,
+                    column_count_ref,
+                    paint_state,
+                    search_state,
+                    per_source_limit_ref,
+                    per_source_limit_state,
+                )
+
             if search_state["editing"]:
                 if not key:
                     continue
@@ -1169,7 +1439,7 @@ def execute(config: NewsAppConfig) -> None:
                     scroll_ref[0] = 10**9
                     stick_bottom_ref[0] = True
                     if new_lim > prev:
-                        news_feed.update(fetch_limit_per_source=_feed_fetch_per_source())
+                        refresh_worker.request_refresh()
                     persist_ui_state()
                     refresh_display(
                         term,
@@ -1349,19 +1619,7 @@ def execute(config: NewsAppConfig) -> None:
                     per_source_limit_state,
                 )
             elif key in ("r", "R"):
-                news_feed.update(fetch_limit_per_source=_feed_fetch_per_source())
-                refresh_display(
-                    term,
-                    news_feed,
-                    view_mode_ref[0],
-                    scroll_ref,
-                    stick_bottom_ref,
-                    column_count_ref,
-                    paint_state,
-                    search_state,
-                    per_source_limit_ref,
-                    per_source_limit_state,
-                )
+                refresh_worker.request_refresh()
 
             elif key.code == term.KEY_UP or key == "k":
                 scroll_ref[0] -= 1
@@ -1452,22 +1710,3 @@ def execute(config: NewsAppConfig) -> None:
                     per_source_limit_state,
                 )
 
-            now = time.monotonic()
-            if now - last_poll >= interval:
-                if news_feed.update(fetch_limit_per_source=_feed_fetch_per_source()):
-                    refresh_display(
-                        term,
-                        news_feed,
-                        view_mode_ref[0],
-                        scroll_ref,
-                        stick_bottom_ref,
-                        column_count_ref,
-                        paint_state,
-                        search_state,
-                        per_source_limit_ref,
-                        per_source_limit_state,
-                    )
-                last_poll = now
-
-        persist_ui_state()
-
@@ -1,4 +1,6 @@
-from typing import List, TypedDict
+import hashlib
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, TypedDict, Union
 
 
 class NewsSource(TypedDict):
@@ -21,15 +23,252 @@ class NewsArticle(TypedDict):
     guid: str
 
 
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ArticleSource:
+    """
+    Read-only ``NewsSource``; one shared instance per (id, name), obtained via ``of``.
+    Supports ``source["name"]`` / ``source.get("name")`` like the dict it replaces.
+    """
+
+    __slots__ = ("id", "name")
+
+    id: Union[str, None]
+    name: Union[str, None]
+
+    _instances: Dict[Tuple[Any, Any], "ArticleSource"] = {}
+
+    def __init__(self, id: Union[str, None], name: Union[str, None]):
+        self.id = id
+        self.name = name
+
+    @classmethod
+    def of(cls, id: Union[str, None], name: Union[str, None]) -> "ArticleSource":
+        key = (id, name)
+        source = cls._instances.get(key)
+        if source is None:
+            source = cls._instances.setdefault(key, cls(_intern(id), _intern(name)))
+        return source
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "id":
+            return self.id
+        if key == "name":
+            return self.name
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ArticleSource):
+            return self.id == other.id and self.name == other.name
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.name))
+
+    def __repr__(self) -> str:
+        return f"ArticleSource(id={self.id!r}, name={self.name!r})"
+
+    def to_dict(self) -> NewsSource:
+        return NewsSource(id=self.id, name=self.name)
+
+
+_ARTICLE_FIELDS: Tuple[str, ...] = tuple(NewsArticle.__annotations__)
+_ARTICLE_FIELD_SET = frozenset(_ARTICLE_FIELDS)
+
+
+# Guids in these forms are unique across feeds and are used as they are; see ``scoped_guid``.
+_GLOBAL_GUID_PREFIXES = ("http://", "https://", "urn:", "tag:")
+
+
+def scoped_guid(guid: str, scope: str) -> str:
+    """
+    ``guid`` prefixed with ``scope`` (the feed's host), unless it is a URL or URN. Plain guids
+    such as ``12345`` are only unique within one publisher; unscoped, two feeds that both number
+    their items would share IDs and be taken for duplicates of each other.
+    """
+    if not guid or not scope or guid.lower().startswith(_GLOBAL_GUID_PREFIXES):
+        return guid
+    return f"{scope}:{guid}"
+
+
+def stable_article_id(guid: str, url: str, source_name: str = "", title: str = "") -> int:
+    """
+    Signed 64-bit ID (fits an SQLite INTEGER) that is the same across polls and restarts:
+    a hash of the ``guid``, else of the ``url``, else of source name and title. Feed parsers
+    hand over guids already passed through ``scoped_guid``.
+    """
+    if guid:
+        key = "g\0" + guid
+    elif url:
+        key = "u\0" + url
+    else:
+        key = f"t\0{source_name}\0{title}"
+    digest = hashlib.blake2b(key.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class Article:
+    """
+    Slotted, read-only article with the keys of ``NewsArticle``, readable as ``article["title"]``
+    / ``article.get("title")`` or as attributes. A few times smaller than the dict: no per-article
+    dict or nested source dict (sources are shared ``ArticleSource`` instances), tuples instead of
+    lists, and repeated strings (source names, authors, subjects, keywords) interned.
+
+    ``article_id`` (see ``stable_article_id``) identifies the article across polls;
+    ``alternate_sources`` lists other feeds that carry the same story (see ``ArticleStore``).
+    """
+
+    __slots__ = _ARTICLE_FIELDS + ("article_id", "alternate_sources")
+
+    source: ArticleSource
+    author: str
+    title: str
+    description: str
+    url: str
+    urlToImage: str
+    publishedAt: str
+    publishedAtTimestamp: float
+    content: str
+    subjects: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+    guid: str
+    article_id: int
+    alternate_sources: Tuple[ArticleSource, ...]
+
+    def __init__(
+        self,
+        *,
+        source: ArticleSource,
+        author: str = "",
+        title: str = "",
+        description: str = "",
+        url: str = "",
+        urlToImage: str = "",
+        publishedAt: str = "",
+        publishedAtTimestamp: float = 0,
+        content: str = "",
+        subjects: Iterable[str] = (),
+        keywords: Iterable[str] = (),
+        guid: str = "",
+    ):
+        self.source = source
+        self.author = _intern(author)
+        self.title = title
+        self.description = description
+        self.url = url
+        self.urlToImage = urlToImage
+        self.publishedAt = _intern(publishedAt)
+        self.publishedAtTimestamp = publishedAtTimestamp
+        self.content = content
+        self.subjects = tuple(_intern(s) for s in subjects)
+        self.keywords = tuple(_intern(k) for k in keywords)
+        self.guid = guid
+        self.article_id = stable_article_id(guid, url, source.name or "", title or "")
+        self.alternate_sources = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Article":
+        """From a ``NewsArticle``-shaped dict (News API JSON, the HTTP cache file)."""
+        source = data.get("source") or {}
+        return cls(
+            source=ArticleSource.of(source.get("id"), source.get("name")),
+            author=data.get("author"),
+            title=data.get("title"),
+            description=data.get("description"),
+            url=data.get("url"),
+            urlToImage=data.get("urlToImage"),
+            publishedAt=data.get("publishedAt"),
+            publishedAtTimestamp=data.get("publishedAtTimestamp") or 0,
+            content=data.get("content"),
+            subjects=data.get("subjects") or (),
+            keywords=data.get("keywords") or (),
+            guid=data.get("guid") or "",
+        )
+
+    def to_dict(self) -> NewsArticle:
+        article: Dict[str, Any] = {key: getattr(self, key) for key in _ARTICLE_FIELDS}
+        article["source"] = self.source.to_dict()
+        article["subjects"] = list(self.subjects)
+        article["keywords"] = list(self.keywords)
+        return NewsArticle(**article)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _ARTICLE_FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _ARTICLE_FIELD_SET else default
+
+    def __contains__(self, key: object) -> bool:
+        return key in _ARTICLE_FIELD_SET
+
+    def keys(self) -> Tuple[str, ...]:
+        return _ARTICLE_FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_ARTICLE_FIELDS)
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, key) for key in _ARTICLE_FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Article):
+            return self is other or self._values() == other._values()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        return f"Article(title={self.title!r}, source={self.source.name!r}, url={self.url!r})"
+
+
 class NewsResponse(TypedDict):
     status: str
     totalResults: int
-    articles: List[NewsArticle]
+    articles: List[Article]
 
 
-class NewsAppConfig(TypedDict):
+class _NewsAppConfigRequired(TypedDict):
     news_sources: List[str]
     date_time_format: str
     news_update_frequency_in_seconds: int
     locales: List[str]
 
+
+class NewsAppConfig(_NewsAppConfigRequired, total=False):
+    """Required keys above; tuning knobs below fall back to ``NewsFeed`` defaults when absent."""
+
+    fetch_concurrency: int
+    http_connections_per_host: int
+    http_cache: bool
+    # Seconds: a number, or ``[connect, read]``.
+    fetch_timeout_seconds: Union[float, List[float]]
+    source_timeouts: Dict[str, Union[float, List[float]]]
+    update_deadline_seconds: float
+    poll_min_interval_seconds: float
+    poll_max_interval_seconds: float
+    source_backoff_base_seconds: float
+    source_backoff_max_seconds: float
+    # "auto" | "lxml" | "etree"
+    xml_parser: str
+    parse_processes: int
+    # 0 = no limit.
+    retention_max_articles: int
+    retention_max_articles_per_source: int
+    retention_max_age_hours: float
+    retention_archive: bool
+    article_db: bool
+    # 0 = no limit / no budget.
+    max_feed_bytes: int
+    parse_time_budget_seconds: float
+
@@ -0,0 +1,154 @@
+"""
+Feed parsing in worker processes.
+
+Parsing XML, normalizing dates and collecting keywords is pure Python CPU work, so parses on
+several fetch threads still take turns on the GIL. With ``parse_processes`` set, fetch threads
+hand the raw body bytes to a pool of worker processes and get compact ``FeedRecords`` back. The
+workers are started on first use and reused across ``update`` calls, so a refresh does not pay
+for interpreter startup.
+
+Each worker serves one parse at a time over its own pipe. A parse that outlives its time budget
+gets its worker killed (and replaced on demand); the other workers and their parses are not
+affected.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, List, Tuple, Union
+
+from app.XmlFeedParser import FeedRecords, parse_feed_records
+from app.exceptions import FeedRejectedException, NewsSourceException
+
+# Worker processes for parsing (config ``parse_processes``; 0 = parse on the fetch threads).
+DEFAULT_PARSE_PROCESSES = 0
+# Extra seconds a worker gets past the budget (it checks the budget itself) before the kill.
+_KILL_GRACE_SECONDS = 1.0
+
+
+def _worker_main(conn: Connection) -> None:
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        try:
+            reply: Tuple[bool, Any] = (True, parse_feed_records(*task))
+        except Exception as e:
+            # Sent as text: not every exception (lxml's, for one) survives pickling.
+            reply = (False, (isinstance(e, FeedRejectedException), str(e)))
+        conn.send(reply)
+
+
+class _Worker:
+    def __init__(self, context: Any):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn,), name="newsfeed-parse", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join(1.0)
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
+
+
+class ParsePool:
+    processes: int
+    engine_name: str
+    time_budget: Union[float, None]
+    _idle: List[_Worker]
+
+    def __init__(
+        self, processes: int, engine_name: str = "auto", time_budget: Union[float, None] = None
+    ):
+        self.processes = max(1, int(processes))
+        self.engine_name = engine_name
+        self.time_budget = time_budget
+        # "spawn": forking a process that runs fetch threads can copy held locks.
+        self._context = multiprocessing.get_context("spawn")
+        self._idle = []
+        self._started = 0
+        self._closed = False
+        self._available = threading.Condition()
+
+    def parse(self, xml: bytes, limit: Union[int, None], date_time_format: str) -> FeedRecords:
+        """
+        Parses a whole feed body in a worker process. Blocks the calling (fetch) thread, not
+        the GIL. Raises ``FeedRejectedException`` when the parse trips a guard or runs past
+        ``time_budget`` (its worker is then killed).
+        """
+        worker = self._acquire()
+        task = (xml, limit, date_time_format, self.engine_name, self.time_budget)
+        timeout = None if self.time_budget is None else self.time_budget + _KILL_GRACE_SECONDS
+        try:
+            worker.conn.send(task)
+            if not worker.conn.poll(timeout):
+                logging.debug(f"Parse worker {worker.process.pid} over budget; killing it")
+                self._discard(worker, kill=True)
+                raise FeedRejectedException(
+                    f"Feed parse exceeded its {self.time_budget:g}s budget"
+                )
+            ok, value = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            self._discard(worker, kill=True)
+            raise NewsSourceException(f"Parse worker died: {e}") from e
+        self._release(worker)
+        if ok:
+            return value
+        rejected, message = value
+        raise (FeedRejectedException if rejected else NewsSourceException)(message)
+
+    def close(self) -> None:
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for worker in idle:
+            worker.stop()
+
+    def _acquire(self) -> _Worker:
+        with self._available:
+            while True:
+                if self._closed:
+                    raise NewsSourceException("Parse pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._started < self.processes:
+                    self._started += 1
+                    break
+                self._available.wait()
+        try:
+            return _Worker(self._context)
+        except Exception:
+            self._discard(None, kill=False)
+            raise
+
+    def _release(self, worker: _Worker) -> None:
+        with self._available:
+            if self._closed:
+                worker.stop()
+                return
+            self._idle.append(worker)
+            self._available.notify()
+
+    def _discard(self, worker: Union[_Worker, None], kill: bool) -> None:
+        if worker is not None and kill:
+            worker.kill()
+        with self._available:
+            self._started -= 1
+            self._available.notify()
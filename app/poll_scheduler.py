@@ -0,0 +1,83 @@
+"""
+Per-source polling intervals learned from each feed's publish cadence.
+
+Every source starts at the configured ``news_update_frequency_in_seconds``. After each poll the
+interval moves toward the typical gap between the feed's ``publishedAtTimestamp`` values (and
+stretches while the feed stays quiet), bounded by ``poll_min_interval_seconds`` /
+``poll_max_interval_seconds``. A random jitter on every due time spreads requests out instead of
+polling all sources in one burst.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+from typing import Dict, Iterable, List, Union
+
+DEFAULT_POLL_MIN_INTERVAL_SECONDS = 60.0
+DEFAULT_POLL_MAX_INTERVAL_SECONDS = 1800.0
+# Due times land within ±this fraction of the interval.
+_JITTER_FRACTION = 0.15
+# Weight of the newest cadence estimate against the current interval (0..1).
+_CADENCE_SMOOTHING = 0.5
+
+
+class PollScheduler:
+    min_interval: float
+    max_interval: float
+    _intervals: Dict[str, float]
+    _next_due: Dict[str, float]
+
+    def __init__(
+        self,
+        sources: Iterable[str],
+        default_interval: float,
+        min_interval: float = DEFAULT_POLL_MIN_INTERVAL_SECONDS,
+        max_interval: float = DEFAULT_POLL_MAX_INTERVAL_SECONDS,
+        rng: Union[random.Random, None] = None,
+    ):
+        self.min_interval = max(1.0, float(min_interval))
+        self.max_interval = max(self.min_interval, float(max_interval))
+        start = self._clamp(float(default_interval))
+        self._rng = rng if rng is not None else random.Random()
+        self._intervals = {}
+        self._next_due = {}
+        for source in sources:
+            self._intervals[source] = start
+            # Everything is due at once for the first refresh; jitter spreads later polls.
+            self._next_due[source] = 0.0
+
+    def due_sources(self, now: float) -> List[str]:
+        """Sources whose next poll time has passed, in configuration order."""
+        return [source for source, due in self._next_due.items() if due <= now]
+
+    def seconds_until_next_due(self, now: float) -> float:
+        if not self._next_due:
+            return self.max_interval
+        return max(0.0, min(self._next_due.values()) - now)
+
+    def record_poll(self, source: str, published_timestamps: Iterable[float], now: float) -> None:
+        """
+        Learn from the items seen in a poll of ``source`` and schedule its next poll.
+
+        @param published_timestamps: ``publishedAtTimestamp`` values from the poll (0 = unknown).
+        @param now: Current Unix time.
+        """
+        if source not in self._intervals:
+            return
+        stamps = sorted((t for t in published_timestamps if t > 0), reverse=True)
+        interval = self._intervals[source]
+        if len(stamps) >= 2:
+            gaps = [newer - older for newer, older in zip(stamps, stamps[1:]) if newer > older]
+            if gaps:
+                cadence = statistics.median(gaps)
+                # A feed quiet for longer than its usual gap is polled less often until it wakes up.
+                cadence = max(cadence, (now - stamps[0]) / 2)
+                interval = (1 - _CADENCE_SMOOTHING) * interval + _CADENCE_SMOOTHING * cadence
+        interval = self._clamp(interval)
+        self._intervals[source] = interval
+        jitter = self._rng.uniform(-_JITTER_FRACTION, _JITTER_FRACTION) * interval
+        self._next_due[source] = now + interval + jitter
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
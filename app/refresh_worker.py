@@ -0,0 +1,97 @@
+"""
+Background feed refresh for the TUI.
+
+``NewsFeed.update`` runs on a daemon thread so the input loop in ``app/main.py`` never blocks
+on the network. ``update`` publishes its result by swapping ``NewsFeed.articles`` in one
+assignment, so readers always see either the previous or the new list, never a partial one.
+
+Which sources are polled when is decided by a ``PollScheduler``; a manual refresh polls all.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from app.poll_scheduler import PollScheduler
+
+if TYPE_CHECKING:
+    from app.NewsFeed import NewsFeed
+
+
+class RefreshWorker:
+    news_feed: NewsFeed
+    scheduler: PollScheduler
+
+    def __init__(
+        self,
+        news_feed: NewsFeed,
+        scheduler: PollScheduler,
+        fetch_limit_per_source: Callable[[], int],
+    ):
+        self.news_feed = news_feed
+        self.scheduler = scheduler
+        self._fetch_limit_per_source = fetch_limit_per_source
+        self._wake = threading.Event()
+        self._poll_all = False
+        self._changed = threading.Event()
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="newsfeed-refresh", daemon=True
+        )
+
+    def start(self) -> None:
+        """Starts the worker; the first refresh (of every source) begins immediately."""
+        self.request_refresh()
+        self._thread.start()
+
+    def request_refresh(self) -> None:
+        """
+        Poll every source as soon as possible (right after the current refresh if one is
+        running), regardless of their scheduled times.
+        """
+        self._poll_all = True
+        self._wake.set()
+
+    def take_update(self) -> bool:
+        """True once after a refresh changed ``news_feed.articles``; the caller repaints."""
+        if not self._changed.is_set():
+            return False
+        self._changed.clear()
+        return True
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._stopping = True
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.scheduler.seconds_until_next_due(time.time()))
+            self._wake.clear()
+            if self._stopping:
+                break
+            if self._poll_all:
+                self._poll_all = False
+                sources = list(self.news_feed.news_sources)
+            else:
+                sources = self.scheduler.due_sources(time.time())
+            if not sources:
+                continue
+            try:
+                if self.news_feed.update(
+                    fetch_limit_per_source=self._fetch_limit_per_source(), sources=sources
+                ):
+                    self._changed.set()
+            except Exception as e:
+                logging.debug(f"Background refresh failed: {e}")
+            now = time.time()
+            for source in sources:
+                response = self.news_feed.last_response(source)
+                stamps = (
+                    [a["publishedAtTimestamp"] for a in response["articles"]] if response else []
+                )
+                self.scheduler.record_poll(source, stamps, now)
@@ -0,0 +1,125 @@
+"""
+Precomputed Snowball tables for the similar-content view.
+
+The stemmed stopwords, the Finnish and Swedish meta-word stems and the keyword shelf stems
+depend only on the word lists in ``app.article_views``, the enabled locale packs and the nltk
+version. They are generated ahead of time, for every combination of the Finnish and Swedish
+packs, into ``stem_tables.json`` (package data) and read in one go on first use; switching
+locales then only picks another entry.
+
+Regenerate after editing a word list or upgrading nltk::
+
+    python -m app.stem_tables        # or: make stem-tables
+
+The file records a digest of its inputs. A file whose digest does not match the running code
+is ignored and the tables are computed at runtime as before.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from importlib import resources
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict
+
+STEM_TABLES_FILE = "stem_tables.json"
+# Bump when the file layout changes.
+_STEM_TABLES_FORMAT = 1
+# English core and boiler packs are always merged, so only these bases change the tables.
+LOCALE_TABLE_BASES: Tuple[Tuple[str, ...], ...] = ((), ("fi",), ("sv",), ("fi", "sv"))
+
+
+class LocaleStemTables(TypedDict):
+    term_stopwords: frozenset[str]
+    shelf_stem_sets: List[Tuple[str, frozenset[str]]]
+
+
+class StemTables(TypedDict):
+    fi_meta_stems: frozenset[str]
+    sv_meta_stems: frozenset[str]
+    # Keyed by ``locale_tables_key``.
+    locales: Dict[str, LocaleStemTables]
+
+
+def locale_tables_key(bases: Sequence[str]) -> str:
+    """``""``, ``"fi"``, ``"sv"`` or ``"fi+sv"`` for the enabled locale bases."""
+    return "+".join(b for b in ("fi", "sv") if b in bases)
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, dict):
+        return {k: _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def stem_tables_digest(inputs: Dict[str, Any]) -> str:
+    """SHA-256 of the word lists, constants and nltk version the tables are derived from."""
+    payload = json.dumps(
+        {"format": _STEM_TABLES_FORMAT, **_canonical(inputs)},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def stem_tables_file_path() -> Path:
+    return Path(str(resources.files("app").joinpath(STEM_TABLES_FILE)))
+
+
+def load_stem_tables(digest: str, path: Optional[Path] = None) -> Optional[StemTables]:
+    """The packaged tables, or None when the file is missing or was built from other inputs."""
+    path = path if path is not None else stem_tables_file_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logging.debug(f"Could not read stem tables {path}: {e}")
+        return None
+    if not isinstance(data, dict) or data.get("digest") != digest:
+        logging.debug(f"Stem tables {path} are out of date; computing them at runtime")
+        return None
+    try:
+        return StemTables(
+            fi_meta_stems=frozenset(data["fi_meta_stems"]),
+            sv_meta_stems=frozenset(data["sv_meta_stems"]),
+            locales={
+                key: LocaleStemTables(
+                    term_stopwords=frozenset(entry["term_stopwords"]),
+                    shelf_stem_sets=[
+                        (heading, frozenset(stems)) for heading, stems in entry["shelf_stem_sets"]
+                    ],
+                )
+                for key, entry in data["locales"].items()
+            },
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        logging.debug(f"Malformed stem tables {path}: {e}")
+        return None
+
+
+def dump_stem_tables(tables: StemTables, digest: str, path: Optional[Path] = None) -> Path:
+    path = path if path is not None else stem_tables_file_path()
+    payload = {"format": _STEM_TABLES_FORMAT, "digest": digest, **_canonical(tables)}
+    path.write_text(
+        json.dumps(payload, ensure_ascii=False, indent=1, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return path
+
+
+def main() -> None:
+    # Imported here: ``app.article_views`` imports this module.
+    from app import article_views
+
+    inputs = article_views.stem_table_inputs()
+    path = dump_stem_tables(article_views.compute_stem_tables(), stem_tables_digest(inputs))
+    print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
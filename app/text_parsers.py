@@ -1,33 +1,22 @@
-from dateutil.parser import parse as dateutil_parse
-from zoneinfo import ZoneInfo
 from datetime import datetime
 from typing import List, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import re
 
+from app import dates
+
 
 def parse_date_from_text(date_text: str) -> Union[datetime, None]:
+    """Local-time datetime for a feed date (RFC 822 / ISO 8601 fast paths, see ``app.dates``)."""
     try:
-        parsed_date = dateutil_parse(date_text)
-
-        # Get the local timezone
-        local_tz = datetime.now().astimezone().tzinfo
-
-        # Convert the datetime object to the local timezone
-        if parsed_date.tzinfo is None:
-            # If the parsed datetime is naive, assume it's UTC
-            parsed_date = parsed_date.replace(tzinfo=ZoneInfo("UTC"))
-
-        local_date = parsed_date.astimezone(local_tz)
-
-        # Return the formatted local time string
-        return local_date
+        return dates.parse_date(date_text)
     except Exception:
         pass
     return None
 
 
 def format_date(date: datetime, date_time_format: str = "%d.%m.%Y %H:%M:%S") -> str:
-    return date.strftime(date_time_format)
+    return dates.format_date(date, date_time_format)
 
 
 def format_date_text(date_text: str, date_time_format: str = "%d.%m.%Y %H:%M:%S") -> str:
@@ -48,6 +37,58 @@ def parse_domain(url: str) -> str:
     return url.split("/")[2]
 
 
+# Query parameters that only track the click (campaign, referrer, ad ids); dropped when
+# comparing article URLs.
+_TRACKING_QUERY_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "ocid",
+        "cmpid",
+        "smid",
+        "ito",
+        "ref",
+        "ref_src",
+    }
+)
+_TRACKING_QUERY_PREFIXES = ("utm_", "at_")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonical_url(url: str) -> str:
+    """
+    Form of an article URL used to recognize the same story across feeds: scheme-less
+    (http and https match), lower-case host without ``www.`` or default port, no fragment,
+    no trailing slash, tracking parameters dropped and the rest sorted.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if port is not None and port != _DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+    query = urlencode(
+        sorted(
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if k.lower() not in _TRACKING_QUERY_PARAMS
+            and not k.lower().startswith(_TRACKING_QUERY_PREFIXES)
+        )
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(("", host, path, query, ""))
+
+
 def trim_text(text: Union[str, None]) -> str:
     trimmed_text = text.strip() if text is not None else ""
     # Replace newlines and tabs with spaces
@@ -0,0 +1,128 @@
+"""
+Last screen of the TUI, saved on exit so the next launch can paint it before anything else is
+loaded: the view settings and terminal it was drawn for, the article IDs and sections it showed,
+and the wrapped body lines. Lives in the user cache directory; a missing or outdated file only
+means the first frame waits for the normal build.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+import platformdirs
+
+_UI_SNAPSHOT_FILE = "ui_snapshot.json"
+# Bump when the layout changes; older files are ignored instead of misread.
+_UI_SNAPSHOT_VERSION = 1
+
+
+class UiSnapshot(TypedDict):
+    version: int
+    # ``Terminal.kind`` and color count the lines were rendered for (escape sequences differ).
+    terminal: str
+    hw: Tuple[int, int]
+    view_mode: str
+    column_count: int
+    per_source_limit: int
+    scroll: int
+    stick_bottom: bool
+    article_ids: List[int]
+    # ``[heading, [article_id, ...]]`` per section.
+    sections: List[Tuple[Optional[str], List[int]]]
+    # ``BodyLayout`` fields.
+    layout: Dict[str, Any]
+
+
+def ui_snapshot_file_path() -> Path:
+    """``{user_cache_dir}/newsfeed/ui_snapshot.json`` (e.g. ``~/.cache/newsfeed`` on Linux)."""
+    return Path(platformdirs.user_cache_dir("newsfeed", appauthor=False)) / _UI_SNAPSHOT_FILE
+
+
+# Top-level keys and the JSON types ``load_ui_snapshot`` requires of them.
+_FIELD_TYPES: Dict[str, Any] = {
+    "terminal": str,
+    "hw": list,
+    "view_mode": str,
+    "column_count": int,
+    "per_source_limit": int,
+    "scroll": int,
+    "stick_bottom": bool,
+    "article_ids": list,
+    "sections": list,
+    "layout": dict,
+}
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_lines(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(line, str) for line in value)
+
+
+def _is_valid_snapshot(data: Dict[str, Any]) -> bool:
+    """Every field present with its type, down to the IDs and lines (a hand-edited or cut file)."""
+    if any(not isinstance(data.get(key), kind) for key, kind in _FIELD_TYPES.items()):
+        return False
+    if len(data["hw"]) != 2 or not all(_is_int(n) for n in data["hw"]):
+        return False
+    if not all(_is_int(i) for i in data["article_ids"]):
+        return False
+    for section in data["sections"]:
+        if not (isinstance(section, list) and len(section) == 2):
+            return False
+        heading, ids = section
+        if not (heading is None or isinstance(heading, str)):
+            return False
+        if not (isinstance(ids, list) and all(_is_int(i) for i in ids)):
+            return False
+    layout = data["layout"]
+    single, columns = layout.get("single"), layout.get("columns")
+    return (
+        all(_is_int(layout.get(key)) for key in ("n_cols", "col_width", "gutter"))
+        and isinstance(layout.get("split"), bool)
+        and (single is None or _is_lines(single))
+        and (columns is None or (isinstance(columns, list) and all(_is_lines(c) for c in columns)))
+        and isinstance(layout.get("col_xs"), list)
+        and all(_is_int(x) for x in layout["col_xs"])
+    )
+
+
+def load_ui_snapshot() -> Optional[UiSnapshot]:
+    """The saved snapshot, or None when it is missing, from another version or malformed."""
+    path = ui_snapshot_file_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _UI_SNAPSHOT_VERSION:
+        return None
+    if not _is_valid_snapshot(data):
+        logging.debug(f"Ignoring malformed UI snapshot {path}")
+        return None
+    return UiSnapshot(**data)
+
+
+def save_ui_snapshot(snapshot: Dict[str, Any]) -> None:
+    path = ui_snapshot_file_path()
+    payload = json.dumps(
+        {**snapshot, "version": _UI_SNAPSHOT_VERSION}, ensure_ascii=False, separators=(",", ":")
+    )
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(payload, encoding="utf-8")
+        tmp.replace(path)
+    except OSError as e:
+        logging.debug(f"Could not write UI snapshot {path}: {e}")
+
+
+def discard_ui_snapshot() -> None:
+    try:
+        ui_snapshot_file_path().unlink()
+    except OSError:
+        pass
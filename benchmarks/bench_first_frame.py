@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""
+Time to first frame of the TUI: wall time from starting ``newsfeed.py`` in a pseudo-terminal
+until its header (``Newsfeed —``) is written, then ``q`` to quit. Each run is a new process,
+so interpreter startup and imports are included.
+
+Run from the repository root (``make bench-startup``). Runs offline and leaves your own state
+alone: config, cache and data directories are a throwaway temporary directory, and the only
+configured source is a feed served from localhost. The first run has no UI snapshot yet and
+paints only after loading the feed; later runs paint from the snapshot saved on exit.
+"""
+
+import argparse
+import http.server
+import json
+import os
+import pty
+import select
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_HEADER = "Newsfeed —".encode("utf-8")
+
+_ITEM = (
+    "<item><title>Headline number {i}</title><link>https://example.com/news/{i}</link>"
+    "<guid>https://example.com/news/{i}</guid><category>Category {c}</category>"
+    "<pubDate>Mon, 06 Sep 2021 10:{minute:02d}:00 +0300</pubDate></item>"
+)
+_FEED = (
+    '<?xml version="1.0" encoding="utf-8"?><rss><channel><title>Benchmark feed</title>'
+    + "".join(_ITEM.format(i=i, c=i % 5, minute=i % 60) for i in range(30))
+    + "</channel></rss>"
+).encode("utf-8")
+
+
+class _FeedHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(_FEED)))
+        self.end_headers()
+        self.wfile.write(_FEED)
+
+    def log_message(self, *_args: object) -> None:
+        pass
+
+
+def _bench_environment(home: str, feed_url: str, columns: int, lines: int) -> dict[str, str]:
+    """Environment for ``newsfeed.py`` with every directory under ``home`` and one local feed."""
+    config_dir = os.path.join(home, "newsfeed_config")
+    os.makedirs(config_dir)
+    with open(os.path.join(config_dir, "config.json"), "w", encoding="utf-8") as f:
+        json.dump({"news_sources": [feed_url]}, f)
+    env = dict(
+        os.environ,
+        COLUMNS=str(columns),
+        LINES=str(lines),
+        NEWSFEED_CONFIG_DIR=config_dir,
+        XDG_CONFIG_HOME=os.path.join(home, "config"),
+        XDG_CACHE_HOME=os.path.join(home, "cache"),
+        XDG_DATA_HOME=os.path.join(home, "data"),
+    )
+    env.pop("NEWSFEED_CONFIG", None)
+    env.setdefault("TERM", "xterm-256color")
+    return env
+
+
+def _first_frame_seconds(env: dict[str, str], timeout: float) -> float:
+    start = time.perf_counter()
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.chdir(_ROOT)
+        os.execve(sys.executable, [sys.executable, "newsfeed.py"], env)
+    out = b""
+    elapsed = float("nan")
+    deadline = start + timeout
+    try:
+        while time.perf_counter() < deadline:
+            ready, _, _ = select.select([fd], [], [], 0.005)
+            if not ready:
+                continue
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError:
+                break
+            if not chunk:
+                break
+            out += chunk
+            if _HEADER in out:
+                elapsed = time.perf_counter() - start
+                break
+        os.write(fd, b"q")
+        # Drain until exit so the process can restore the terminal and save its snapshot.
+        while True:
+            ready, _, _ = select.select([fd], [], [], 0.1)
+            if ready:
+                try:
+                    if not os.read(fd, 65536):
+                        break
+                except OSError:
+                    break
+            elif os.waitpid(pid, os.WNOHANG)[0]:
+                pid = 0
+                break
+    finally:
+        if pid:
+            os.waitpid(pid, 0)
+        os.close(fd)
+    return elapsed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait per run")
+    ap.add_argument("--target-ms", type=float, default=100.0)
+    ap.add_argument("--columns", type=int, default=120)
+    ap.add_argument("--lines", type=int, default=40)
+    args = ap.parse_args()
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    feed_url = f"http://127.0.0.1:{server.server_port}/feed.xml"
+    try:
+        with tempfile.TemporaryDirectory(prefix="newsfeed-bench-") as home:
+            env = _bench_environment(home, feed_url, args.columns, args.lines)
+            timings = [_first_frame_seconds(env, args.timeout) * 1000 for _ in range(args.runs)]
+    finally:
+        server.shutdown()
+        server.server_close()
+    for i, ms in enumerate(timings, 1):
+        print(f"run {i}: {ms:.0f} ms")
+    median = statistics.median(timings)
+    verdict = "within" if median <= args.target_ms else "over"
+    print(
+        f"first frame: median {median:.0f} ms, best {min(timings):.0f} ms "
+        f"({verdict} the {args.target_ms:g} ms target)"
+    )
+
+
+if __name__ == "__main__":
+    main()
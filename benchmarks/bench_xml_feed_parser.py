@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for ``XmlFeedParser``: per-item cost of turning ``<item>`` elements into
+articles on a synthetic feed with many categories and keyword tags.
+
+Times the current single-pass item walk against ``FindFindallParser``, the earlier
+implementation that looked up each field with its own ``find`` / ``findall``, on the same
+feed. Both share everything else (tree parse, DTD guard, article objects) and are checked to
+produce the same articles first.
+
+Run from the repository root (``make bench``).
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xml.etree.ElementTree import Element  # noqa: E402
+
+from app.TextFormatter import TextFormatter  # noqa: E402
+from app.XmlFeedParser import (  # noqa: E402
+    _DC_NS,
+    _ITUNES_NS,
+    _MRSS_NS,
+    ArticleRecord,
+    XmlFeedParser,
+    _ns_tag,
+    _split_keyword_blob,
+)
+from app.text_parsers import (  # noqa: E402
+    is_uri_like_metadata_token,
+    parse_date_from_text,
+    trim_text,
+)
+
+_ITEM = """
+<item>
+  <title>Headline number {i}</title>
+  <link>https://example.com/news/{i}</link>
+  <guid isPermaLink="false">example-{i}</guid>
+  <description>Summary text for story {i} with a few words in it.</description>
+  <pubDate>Mon, 06 Sep 2021 10:{minute:02d}:00 +0300</pubDate>
+  <author>Reporter {i}</author>
+  {categories}
+  <dc:subject>Subject {i}</dc:subject>
+  <media:keywords>alpha, beta, gamma, delta {i}</media:keywords>
+  <itunes:keywords>one, two, three</itunes:keywords>
+</item>"""
+
+
+class FindFindallParser(XmlFeedParser):
+    """Reference: the per-field ``find`` / ``findall`` item walk the dispatch table replaced."""
+
+    def _build_record(self, item: Element) -> ArticleRecord:
+        pub_date = self.get_text(item, "pubDate")
+        date_time = parse_date_from_text(pub_date) if pub_date else None
+        subjects: list[str] = []
+        keywords: list[str] = []
+
+        def add_kw(text: str) -> None:
+            t = trim_text(text)
+            if t and t not in keywords and not is_uri_like_metadata_token(t):
+                keywords.append(t)
+
+        def add_sub(text: str) -> None:
+            t = trim_text(text)
+            if t and t not in subjects:
+                subjects.append(t)
+
+        for cat in item.findall("category"):
+            t = trim_text(cat.text or "")
+            if t:
+                add_sub(t)
+                dom = cat.get("domain")
+                if dom:
+                    d = trim_text(dom)
+                    if d and not is_uri_like_metadata_token(d):
+                        add_kw(d)
+
+        for el in item.findall(_ns_tag(_DC_NS, "subject")):
+            blob = trim_text(el.text or "")
+            if blob:
+                add_kw(blob)
+
+        author = self.get_text(item, "author")
+        if not author:
+            creator_el = item.find(_ns_tag(_DC_NS, "creator"))
+            if creator_el is not None:
+                author = trim_text(creator_el.text or "")
+
+        mrss_kw = item.find(_ns_tag(_MRSS_NS, "keywords"))
+        if mrss_kw is not None:
+            blob = trim_text(mrss_kw.text or mrss_kw.get("content") or "")
+            if blob:
+                for p in _split_keyword_blob(blob):
+                    add_kw(p)
+
+        for el in item.findall(_ns_tag(_ITUNES_NS, "keywords")):
+            blob = trim_text(el.text or "")
+            if blob:
+                for p in _split_keyword_blob(blob):
+                    add_kw(p)
+
+        return ArticleRecord(
+            author=author,
+            title=self.get_text(item, "title"),
+            description=self.get_text(item, "description"),
+            url=self.get_text(item, "link"),
+            publishedAt=self.format_datetime(date_time),
+            publishedAtTimestamp=date_time.timestamp() if date_time else 0,
+            subjects=tuple(subjects),
+            keywords=tuple(keywords),
+            guid=self.get_text(item, "guid"),
+        )
+
+
+def build_feed(items: int, categories: int) -> bytes:
+    body = "".join(
+        _ITEM.format(
+            i=i,
+            minute=i % 60,
+            categories="".join(
+                f'<category domain="Topic {c % 7}">Category {c}</category>'
+                for c in range(categories)
+            ),
+        )
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<rss xmlns:dc="http://purl.org/dc/elements/1.1/" '
+        'xmlns:media="http://search.yahoo.com/mrss/" '
+        'xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">'
+        f"<channel><title>Benchmark feed</title>{body}</channel></rss>"
+    ).encode("utf-8")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--items", type=int, default=200)
+    ap.add_argument("--categories", type=int, default=20)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--number", type=int, default=20)
+    args = ap.parse_args()
+
+    feed = build_feed(args.items, args.categories)
+    parsers = {
+        "XmlFeedParser.parse": XmlFeedParser(text_formatter=TextFormatter(), limit=None),
+        "find/findall reference": FindFindallParser(text_formatter=TextFormatter(), limit=None),
+    }
+    outputs = [
+        [article.to_dict() for article in parser.parse(feed)["articles"]]
+        for parser in parsers.values()
+    ]
+    if outputs[0] != outputs[1]:
+        sys.exit("XmlFeedParser and the find/findall reference disagree on this feed")
+
+    print(
+        f"{args.items} items x {args.categories} categories, {len(feed) / 1024:.0f} KiB, "
+        f"best of {args.repeat}:"
+    )
+    per_item_us = {}
+    for name, parser in parsers.items():
+        timings = timeit.repeat(
+            lambda: parser.parse(feed), repeat=args.repeat, number=args.number
+        )
+        per_item_us[name] = min(timings) / args.number / args.items * 1e6
+        print(f"  {name:<24} {per_item_us[name]:7.1f} µs/item")
+    current, reference = per_item_us.values()
+    print(f"  speedup                  {reference / current:7.2f}x")
+
+if __name__ == "__main__":
+    main()
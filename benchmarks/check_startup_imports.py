@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Startup import check: imports ``app.main`` under ``python -X importtime`` and fails when a
+module that is meant to load lazily (nltk, requests, dateutil, ...) is imported at startup.
+
+Run from the repository root (``make check-startup``). Prints the slowest imports and the
+total; ``--max-ms`` also fails when the total import time of ``app.main`` exceeds a budget.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Top-level packages that must not be imported before the first frame: nltk loads with the
+# similar-content view, the rest with ``NewsFeed`` (after the snapshot paint) or on demand.
+_DEFERRED = ("nltk", "requests", "urllib3", "dateutil", "lxml", "sqlite3")
+
+
+def _import_times(module: str) -> list[tuple[int, int, str]]:
+    """``(self_us, cumulative_us, name)`` per module imported by ``import module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--module", default="app.main")
+    ap.add_argument("--max-ms", type=float, default=0.0, help="Import time budget; 0 = none")
+    ap.add_argument("--top", type=int, default=10)
+    args = ap.parse_args()
+
+    rows = _import_times(args.module)
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[0], reverse=True)[: args.top]:
+        print(f"{self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms total  {name}")
+    total_ms = next((r[1] for r in rows if r[2] == args.module), 0) / 1000
+    print(f"import {args.module}: {total_ms:.1f} ms")
+
+    failures = sorted({name.split(".")[0] for _, _, name in rows} & set(_DEFERRED))
+    if failures:
+        print(f"Imported at startup but meant to load lazily: {', '.join(failures)}")
+    if args.max_ms and total_ms > args.max_ms:
+        print(f"Over the {args.max_ms:g} ms import budget")
+    if failures or (args.max_ms and total_ms > args.max_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
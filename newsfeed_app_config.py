@@ -22,6 +22,29 @@ REQUIRED_CONFIG_KEYS = (
     "locales",
 )
 
+# Tuning keys: copied into ``NewsAppConfig`` when present (packaged defaults ship all of them).
+OPTIONAL_CONFIG_KEYS = (
+    "fetch_concurrency",
+    "http_connections_per_host",
+    "http_cache",
+    "fetch_timeout_seconds",
+    "source_timeouts",
+    "update_deadline_seconds",
+    "poll_min_interval_seconds",
+    "poll_max_interval_seconds",
+    "source_backoff_base_seconds",
+    "source_backoff_max_seconds",
+    "xml_parser",
+    "parse_processes",
+    "retention_max_articles",
+    "retention_max_articles_per_source",
+    "retention_max_age_hours",
+    "retention_archive",
+    "article_db",
+    "max_feed_bytes",
+    "parse_time_budget_seconds",
+)
+
 _SUPPORTED_LOCALE_BASES = frozenset({"fi", "sv", "en"})
 
 
@@ -213,9 +236,13 @@ def load_app_config() -> NewsAppConfig:
 
     _validate_locales(data["locales"], config_path=config_path)
 
-    return NewsAppConfig(
+    config = NewsAppConfig(
         news_sources=data["news_sources"],
         date_time_format=data["date_time_format"],
         news_update_frequency_in_seconds=data["news_update_frequency_in_seconds"],
         locales=data["locales"],
     )
+    for key in OPTIONAL_CONFIG_KEYS:
+        if key in data:
+            config[key] = data[key]
+    return config
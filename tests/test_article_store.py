@@ -0,0 +1,134 @@
+from app.article_store import ArticleStore
+from app.news_types import Article, ArticleSource
+
+SHOW = ArticleSource.of("", "Podcast")
+BLOG = ArticleSource.of("", "Live blog")
+WIRE_A = ArticleSource.of("", "Paper A")
+WIRE_B = ArticleSource.of("", "Paper B")
+
+
+def _article(source, title, *, guid="", url="", published=1.0):
+    return Article(
+        source=source, title=title, guid=guid, url=url, publishedAtTimestamp=published
+    )
+
+
+def test_episodes_linking_to_the_show_page_are_kept_apart():
+    store = ArticleStore()
+    episodes = [
+        _article(SHOW, f"Episode {i}", guid=f"show.fm:ep{i}", url="https://show.fm/", published=i)
+        for i in (1, 2, 3)
+    ]
+
+    store.replace_source("https://show.fm/feed", episodes)
+
+    assert [a.title for a in store.snapshot()] == ["Episode 1", "Episode 2", "Episode 3"]
+
+
+def test_live_blog_entries_differing_in_tracking_params_are_kept_apart():
+    store = ArticleStore()
+    entries = [
+        _article(BLOG, "Entry 1", url="https://news.example/live?utm_source=rss", published=1),
+        _article(BLOG, "Entry 2", url="https://news.example/live?ref=rss", published=2),
+    ]
+
+    store.replace_source("https://news.example/live.xml", entries)
+
+    assert [a.title for a in store.snapshot()] == ["Entry 1", "Entry 2"]
+
+
+def test_same_story_from_another_feed_is_collapsed():
+    store = ArticleStore()
+    store.replace_source("a", [_article(WIRE_A, "Story", url="https://wire.example/1")])
+    store.replace_source("b", [_article(WIRE_B, "Story", url="https://wire.example/1?utm_x=1")])
+
+    (story,) = store.snapshot()
+    assert story.source is WIRE_A
+    assert story.alternate_sources == (WIRE_B,)
+
+
+def test_different_guids_are_not_merged_on_url_across_feeds():
+    store = ArticleStore()
+    store.replace_source("a", [_article(WIRE_A, "One", guid="a:1", url="https://x.example/")])
+    store.replace_source("b", [_article(WIRE_B, "Two", guid="b:2", url="https://x.example/")])
+
+    assert len(store) == 2
+
+
+def test_alternate_takes_over_when_the_primary_feed_drops_the_story():
+    store = ArticleStore()
+    store.replace_source("a", [_article(WIRE_A, "Story", url="https://wire.example/1")])
+    store.replace_source("b", [_article(WIRE_B, "Story", url="https://wire.example/1?ref=b")])
+
+    assert store.replace_source("a", []) is True
+    (story,) = store.snapshot()
+    assert story.source is WIRE_B
+    assert story.alternate_sources == ()
+
+    edited = _article(WIRE_B, "Story, updated", url="https://wire.example/1?ref=b")
+    assert store.replace_source("b", [edited]) is True
+    assert [a.title for a in store.snapshot()] == ["Story, updated"]
+
+    assert store.replace_source("b", []) is True
+    assert len(store) == 0
+
+
+class _ListArchive:
+    def __init__(self):
+        self.appended = []
+
+    def append(self, articles):
+        self.appended.extend(a.title for a in articles)
+
+
+def _assert_indexes_match(store):
+    articles = store.snapshot()
+    assert store._keys == sorted(store._keys)
+    assert {a.article_id for a in articles} == set(store._by_id)
+    by_source = {}
+    for article in articles:
+        key = (article.publishedAtTimestamp, article.article_id)
+        by_source.setdefault(article.source, []).append(key)
+    assert store._keys_by_source == by_source
+
+
+def test_retention_age_cut_then_overall_cap():
+    archive = _ListArchive()
+    store = ArticleStore(max_articles=4, max_age_seconds=100, archive=archive)
+    listings = (("a", WIRE_A, (0, 850, 920, 960, 990)), ("b", WIRE_B, (880, 910, 970)))
+    for name, source, times in listings:
+        store.replace_source(
+            name,
+            [
+                _article(source, f"{name}{i}", url=f"https://{name}/{i}", published=t)
+                for i, t in enumerate(times)
+            ],
+        )
+
+    assert store.enforce_retention(now=1000) is True
+
+    # The age cut (before 900) spares the undated a0; the cap of 4 then takes the oldest.
+    assert archive.appended == ["a1", "b0", "a0", "b1"]
+    assert [a.title for a in store.snapshot()] == ["a2", "a3", "b2", "a4"]
+    _assert_indexes_match(store)
+
+
+def test_evicted_article_is_not_restored_and_archived_again_on_every_change():
+    archive = _ListArchive()
+    store = ArticleStore(max_articles=2, archive=archive)
+    listing = [_article(WIRE_A, f"a{i}", url=f"https://a/{i}", published=i) for i in (1, 2, 3)]
+    store.replace_source("a", listing)
+    store.enforce_retention(now=0)
+    assert archive.appended == ["a1"]
+
+    for revision in range(3):
+        changed = _article(WIRE_A, f"a1 rev {revision}", url="https://a/1", published=1)
+        store.replace_source("a", [changed] + listing[1:])
+        store.enforce_retention(now=0)
+
+    assert archive.appended == ["a1"]
+    assert [a.title for a in store.snapshot()] == ["a2", "a3"]
+
+    newer = _article(WIRE_A, "a1 moved up", url="https://a/1", published=5)
+    assert store.replace_source("a", [newer] + listing[1:]) is True
+    _assert_indexes_match(store)
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from app import ui_snapshot
+from app.ui_snapshot import load_ui_snapshot, save_ui_snapshot
+
+
+def _snapshot():
+    return {
+        "terminal": "xterm-256color/256",
+        "hw": [30, 100],
+        "view_mode": "chronological",
+        "column_count": 1,
+        "per_source_limit": 3,
+        "scroll": 0,
+        "stick_bottom": True,
+        "article_ids": [11, -12],
+        "sections": [[None, [11, -12]]],
+        "layout": {
+            "split": False,
+            "n_cols": 1,
+            "single": ["line one", "line two"],
+            "columns": None,
+            "col_width": 100,
+            "gutter": 0,
+            "col_xs": [0],
+        },
+    }
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, monkeypatch):
+    path = tmp_path / "ui_snapshot.json"
+    monkeypatch.setattr(ui_snapshot, "ui_snapshot_file_path", lambda: path)
+    return path
+
+
+def test_saved_snapshot_round_trips(snapshot_path):
+    save_ui_snapshot(_snapshot())
+
+    loaded = load_ui_snapshot()
+
+    assert loaded is not None
+    assert loaded["article_ids"] == [11, -12]
+
+
+@pytest.mark.parametrize(
+    "breakage",
+    [
+        lambda s: s.pop("scroll"),
+        lambda s: s.pop("article_ids"),
+        lambda s: s.update(stick_bottom="yes"),
+        lambda s: s.update(scroll="12"),
+        lambda s: s.update(hw=[30]),
+        lambda s: s.update(article_ids=[11, "12"]),
+        lambda s: s.update(sections=[[None]]),
+        lambda s: s.update(sections=[["Heading", None]]),
+        lambda s: s["layout"].pop("col_xs"),
+        lambda s: s["layout"].update(single=[1, 2]),
+        lambda s: s.update(layout=None),
+    ],
+)
+def test_malformed_snapshot_is_ignored(snapshot_path, breakage):
+    data = _snapshot()
+    breakage(data)
+    snapshot_path.write_text(json.dumps({**data, "version": 1}), encoding="utf-8")
+
+    assert load_ui_snapshot() is None
+
+
+def test_truncated_snapshot_is_ignored(snapshot_path):
+    save_ui_snapshot(_snapshot())
+    snapshot_path.write_text(snapshot_path.read_text(encoding="utf-8")[:60], encoding="utf-8")
+
+    assert load_ui_snapshot() is None